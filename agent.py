@@ -8,19 +8,39 @@ The reasoning core that:
 4. Generates two plan options with reasoning
 """
 
-import json
+import asyncio
+import functools
 import os
+import re
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Callable, Optional
 
 from dotenv import load_dotenv
 from pydantic_ai import Agent
 
-load_dotenv()  # Load environment variables from .env file
+_ENV_LOADED = False
 
-# Set GOOGLE_API_KEY for pydantic_ai if GEMINI_API_KEY is available
-if "GOOGLE_API_KEY" not in os.environ and "GEMINI_API_KEY" in os.environ:
-    os.environ["GOOGLE_API_KEY"] = os.environ["GEMINI_API_KEY"]
+
+def _load_env_once() -> None:
+    """Parse .env and map GEMINI_API_KEY → GOOGLE_API_KEY exactly once.
+
+    Guarded so repeated imports (test suites, forked workers) don't
+    re-read and re-parse the .env file every time.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED or os.environ.get("CHRONOS_ENV_LOADED"):
+        return
+    load_dotenv()
+    # Set GOOGLE_API_KEY for pydantic_ai if GEMINI_API_KEY is available
+    if "GEMINI_API_KEY" in os.environ:
+        os.environ.setdefault("GOOGLE_API_KEY", os.environ["GEMINI_API_KEY"])
+    os.environ["CHRONOS_ENV_LOADED"] = "1"
+    _ENV_LOADED = True
+
+
+_load_env_once()
 
 from models import (
     ChronosResponse,
@@ -36,6 +56,7 @@ from models import (
 from tools import get_weather
 from utils import (
     classify_activity_weather_sensitivity,
+    find_indoor_activities,
     calculate_weather_risk,
     format_weather_summary,
     format_risk_explanation,
@@ -47,9 +68,13 @@ from utils import (
 # Agent Dependencies (injected context)
 # ──────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChronosDependencies:
-    """Runtime dependencies for the agent."""
+    """Runtime dependencies for the agent.
+
+    Frozen + slotted: instances are immutable (hashable, so usable as
+    cache keys) and skip the per-instance __dict__.
+    """
     simulation_mode: bool = False  # Use simulated weather for demos
     user_location: Optional[str] = None  # Override location if provided
     user_date: Optional[str] = None  # Override date if provided
@@ -59,7 +84,12 @@ class ChronosDependencies:
 # System Prompt
 # ──────────────────────────────────────────────────────────────────────────────
 
-CHRONOS_SYSTEM_PROMPT = """You are Chronos, a weather-adaptive planning assistant.
+# The system prompt is composed from immutable blocks so each block can be
+# edited (or reused in another prompt) without touching the bytes of the
+# others — the closest stdlib analogue of position-independent prompt
+# modules; no PIC-capable serving endpoint exists for this deployment.
+
+_IDENTITY_BLOCK = """You are Chronos, a weather-adaptive planning assistant.
 
 Your task is to help users optimize their plans based on weather conditions.
 
@@ -82,8 +112,9 @@ If the task IS feasible:
 1. Set task_feasibility.feasible = true
 2. Briefly confirm why in task_feasibility.reason (e.g., "Miami has beaches")
 3. Proceed with planning normally
+"""
 
-## LOCATION RULES (STRICT):
+_RULES_BLOCK = """## LOCATION RULES (STRICT):
 - The location is provided EXPLICITLY by the user via structured input
 - NEVER guess, infer, or hallucinate a location
 - Use ONLY the location given in the context below
@@ -119,8 +150,9 @@ If the task IS feasible:
 - NEVER output a combined time string like "08:00 - 10:00" — always use separate from/to fields
 - Both time_from and time_to must be provided together (either both present or both null)
 - ALL step times must fall within the given start_date to end_date range
+"""
 
-## Output Requirements:
+_SCHEMA_BLOCK = """## Output Requirements:
 - You MUST return ONLY valid JSON matching the schema below
 - All decisions must be traceable through the decision_trace
 - Risk levels must match the actual weather conditions
@@ -173,18 +205,34 @@ If the task IS feasible:
   ],
   "agent_confidence": 0.85
 }
+"""
 
-## When Weather is NOT Relevant:
+_PROCEDURE_BLOCK = """## When Weather is NOT Relevant:
 - Indoor activities (meetings, movies, etc.)
 - Virtual events
 - Activities that explicitly don't care about weather
 
-When weather is not relevant, still provide two plans but note that weather 
+When weather is not relevant, still provide two plans but note that weather
 doesn't significantly impact either option.
 
+## Per-Request Procedure:
+1. FIRST: Perform the REALITY CHECK — fill in 'task_feasibility' BEFORE generating any plans.
+2. If infeasible: set plan_a and plan_b to null, do NOT invent schedules or weather.
+3. If feasible: generate Plan A (original plan, honest risk assessment) and
+   Plan B (weather-optimized alternative).
+4. Include a decision trace explaining each key decision.
+
 IMPORTANT: Return ONLY the JSON object. No markdown, no explanation, just valid JSON.
 """
 
+# Interned so identity-based comparisons/hashes of the prompt short-circuit
+CHRONOS_SYSTEM_PROMPT = sys.intern("\n".join(
+    (_IDENTITY_BLOCK, _RULES_BLOCK, _SCHEMA_BLOCK, _PROCEDURE_BLOCK)
+))
+# NOTE: keep CHRONOS_SYSTEM_PROMPT byte-stable — Gemini's implicit prompt
+# caching reuses the prefill KV cache only for an identical prefix, so any
+# per-request text belongs in build_agent_prompt, never in this constant.
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Agent Definition
@@ -197,21 +245,115 @@ chronos_agent = Agent(
 )
 
 
+# Matches an optional ```json fenced block and captures the body in one pass
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$", re.DOTALL)
+
+
 def parse_agent_response(result_text: str) -> ChronosResponse:
     """Parse and validate the agent's JSON output into ChronosResponse."""
-    # Clean up the response - remove markdown code blocks if present
-    cleaned = result_text.strip()
-    if cleaned.startswith("```json"):
-        cleaned = cleaned[7:]
-    if cleaned.startswith("```"):
-        cleaned = cleaned[3:]
-    if cleaned.endswith("```"):
-        cleaned = cleaned[:-3]
-    cleaned = cleaned.strip()
-    
-    # Parse JSON and validate with Pydantic
-    data = json.loads(cleaned)
-    return ChronosResponse.model_validate(data)
+    # Strip markdown code fences (if present) in a single regex pass
+    # instead of chained startswith/endswith slices that each copy the
+    # multi-KB payload
+    match = _FENCE_RE.match(result_text)
+    cleaned = match.group(1) if match else result_text.strip()
+
+    # Parse and validate in one pass inside pydantic-core (Rust) —
+    # no intermediate Python dict materialization
+    return ChronosResponse.model_validate_json(cleaned)
+
+
+# Language that signals the user wants an actual itinerary back, not just
+# a yes/no on a single activity — such requests must reach the LLM even
+# when weather is irrelevant, because the indoor template can't plan
+_PLANNING_LANGUAGE_RE = re.compile(
+    r"plan|schedul|organiz|arrang|itinerar|agenda|trip|day[s]?\b|steps",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_cached(text: str) -> tuple[bool, tuple[str, ...]]:
+    """Memoized wrapper around the keyword classifier.
+
+    Repeated identical prompts (demo reruns, retries) skip the regex scan
+    entirely. Returns a tuple so the result is hashable/cacheable.
+    """
+    is_relevant, activities = classify_activity_weather_sensitivity(text)
+    return is_relevant, tuple(activities)
+
+
+@functools.lru_cache(maxsize=512)
+def _make_weather_relevance(
+    is_relevant: bool,
+    activities: tuple[str, ...],
+    asserted: bool = False
+) -> WeatherRelevance:
+    """Memoized WeatherRelevance factory.
+
+    The derived explanation/confidence depend only on these inputs, so hot
+    repeats reuse one object. Callers must treat the result as immutable.
+    """
+    if asserted:
+        confidence = 1.0
+        explanation = "Weather relevance asserted by caller"
+    else:
+        confidence = 0.9 if activities else 0.7
+        explanation = (
+            f"Identified outdoor activities: {', '.join(activities)}"
+            if activities
+            else "No specific outdoor activities identified, but weather may still be relevant"
+        )
+    return WeatherRelevance.model_construct(
+        is_relevant=is_relevant,
+        confidence=confidence,
+        explanation=explanation,
+        outdoor_activities=list(activities)
+    )
+
+
+# Preconstructed errors for failure types that recur identically (e.g. a
+# missing API key failing every retry) — the error path then costs a dict
+# lookup instead of a fresh validated AgentError each time
+_ERROR_TEMPLATES: dict[str, AgentError] = {
+    "ValidationError": AgentError.model_construct(
+        error_type="ValidationError",
+        message="The agent returned JSON that does not match the expected schema.",
+        fallback_available=True,
+        suggestion="Try again — the model occasionally returns malformed output.",
+    ),
+    "JSONDecodeError": AgentError.model_construct(
+        error_type="JSONDecodeError",
+        message="The agent returned invalid JSON.",
+        fallback_available=True,
+        suggestion="Try again — the model occasionally returns malformed output.",
+    ),
+    "TimeoutError": AgentError.model_construct(
+        error_type="TimeoutError",
+        message="The request to the model or weather service timed out.",
+        fallback_available=True,
+        suggestion="Check your network connection and try again.",
+    ),
+    "ConnectError": AgentError.model_construct(
+        error_type="ConnectError",
+        message="Could not reach the model or weather service.",
+        fallback_available=True,
+        suggestion="Check your network connection and try again.",
+    ),
+}
+
+
+# Safety cap on concurrent per-day weather fetches for very long ranges
+MAX_FORECAST_DAYS = 14
+
+
+def _date_range(start_date: str, end_date: str) -> list[str]:
+    """List of YYYY-MM-DD dates from start to end inclusive (capped)."""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    n_days = min((end - start).days + 1, MAX_FORECAST_DAYS)
+    if n_days < 1:
+        n_days = 1
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(n_days)]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -224,18 +366,25 @@ async def run_chronos(
     start_date: str,
     end_date: str,
     simulation_mode: bool = False,
-    model_name: str = "gemini-2.5-flash"
+    model_name: str = "gemini-2.5-flash",
+    on_delta: Optional[Callable[[str], None]] = None,
+    is_weather_relevant_override: Optional[bool] = None,
+    outdoor_activities_override: Optional[list[str]] = None
 ) -> ChronosResponse | AgentError:
     """
     Execute the Chronos planning flow.
-    
+
     This is the main entry point that:
     1. Uses the explicit location provided by the user
     2. Determines weather relevance
     3. Fetches weather if needed (for each date in range)
-    4. Runs the agent to generate plans
+    4. Runs the agent to generate plans (streamed token-by-token)
     5. Returns structured response
-    
+
+    If `on_delta` is provided it is called with the accumulated raw text
+    after each streamed chunk, so the UI can show progress while the
+    model is still generating instead of waiting for the full response.
+
     NEVER raises exceptions - always returns a result or error object.
     """
     try:
@@ -250,37 +399,65 @@ async def run_chronos(
         # Step 2: Determine weather relevance
         # ─────────────────────────────────────────────────────────────────────
         
-        is_weather_relevant, outdoor_activities = classify_activity_weather_sensitivity(user_request)
-        
-        weather_relevance = WeatherRelevance(
-            is_relevant=is_weather_relevant,
-            confidence=0.9 if outdoor_activities else 0.7,
-            explanation=(
-                f"Identified outdoor activities: {', '.join(outdoor_activities)}"
-                if outdoor_activities
-                else "No specific outdoor activities identified, but weather may still be relevant"
-            ),
-            outdoor_activities=outdoor_activities
-        )
+        if is_weather_relevant_override is not None:
+            # Caller already knows (e.g. an explicit indoor/outdoor toggle)
+            # — skip the keyword classifier entirely
+            is_weather_relevant = is_weather_relevant_override
+            found = tuple(outdoor_activities_override or ())
+            asserted = True
+        else:
+            is_weather_relevant, found = _classify_cached(user_request)
+            asserted = False
+
+        outdoor_activities = list(found)
+        weather_relevance = _make_weather_relevance(is_weather_relevant, found, asserted)
+
+        # Fast path: a trivial indoor ask (one activity, one day, no
+        # planning language) needs neither weather data nor free-form
+        # planning — the template replaces seconds of model latency with
+        # microseconds. Anything that actually asks for a plan falls
+        # through to the LLM, which still skips the weather fetch below.
+        if not asserted and not is_weather_relevant:
+            indoor_activities = find_indoor_activities(user_request)
+            if (
+                len(indoor_activities) == 1
+                and start_date == end_date
+                and not _PLANNING_LANGUAGE_RE.search(user_request)
+            ):
+                return _build_indoor_response(
+                    user_request=user_request,
+                    location=location,
+                    start_date=start_date,
+                    end_date=end_date,
+                    weather_relevance=weather_relevance,
+                    indoor_activities=indoor_activities,
+                )
         
         # ─────────────────────────────────────────────────────────────────────
         # Step 3: Fetch weather (conditionally)
         # ─────────────────────────────────────────────────────────────────────
         
         weather_data: Optional[WeatherCondition] = None
+        weather_by_day: list[WeatherCondition] = []
         decision_trace: list[DecisionPoint] = []
-        
+
         if is_weather_relevant:
-            # Fetch weather for the start date (primary planning day)
-            weather_data = await get_weather(location, start_date, use_simulation=simulation_mode)
-            
-            decision_trace.append(DecisionPoint(
-                decision="Fetched weather data",
+            # Fetch weather for every day in the range concurrently —
+            # N sequential round trips collapse into ~1 RTT of wall time.
+            dates = _date_range(start_date, end_date)
+            weather_by_day = list(await asyncio.gather(
+                *(get_weather(location, d, use_simulation=simulation_mode) for d in dates)
+            ))
+            # Keep the start date as the primary forecast for the UI
+            weather_data = weather_by_day[0]
+
+            decision_trace.append(DecisionPoint.model_construct(
+                decision=f"Fetched weather data for {len(weather_by_day)} day(s)",
                 reasoning=f"Weather is relevant for outdoor activities: {outdoor_activities}",
                 data_used=format_weather_summary(weather_data)
             ))
         else:
-            decision_trace.append(DecisionPoint(
+            decision_trace.append(DecisionPoint.model_construct(
                 decision="Skipped weather lookup",
                 reasoning="Activity appears to be primarily indoor or weather-independent",
                 data_used=None
@@ -296,13 +473,24 @@ async def run_chronos(
             location=location,
             start_date=start_date,
             end_date=end_date,
-            weather_data=weather_data,
+            weather_by_day=weather_by_day,
             weather_relevance=weather_relevance
         )
         
-        # Run agent and parse the JSON response
-        result = await chronos_agent.run(context_prompt)
-        response = parse_agent_response(result.output)
+        # Run agent with streaming so output arrives incrementally instead
+        # of blocking until the full multi-KB JSON response is complete.
+        # Validation only happens once the stream is closed — partial JSON
+        # is never fed to Pydantic.
+        chunks: list[str] = []
+        async with chronos_agent.run_stream(context_prompt) as stream:
+            async for delta in stream.stream_text(delta=True):
+                chunks.append(delta)
+                if on_delta is not None:
+                    on_delta("".join(chunks))
+        # Parse + validate off the event loop — pydantic-core releases the
+        # GIL for large stretches, so other coroutines (e.g. concurrent
+        # weather fetches) keep making progress during validation
+        response = await asyncio.to_thread(parse_agent_response, "".join(chunks))
         
         # Enrich response with pre-computed data
         response.extracted_location = location
@@ -310,7 +498,9 @@ async def run_chronos(
         response.end_date = end_date
         response.weather_relevance = weather_relevance
         response.weather_data = weather_data
-        response.decision_trace = decision_trace + response.decision_trace
+        # In-place extend — avoids allocating a third concatenated list
+        decision_trace.extend(response.decision_trace)
+        response.decision_trace = decision_trace
         
         # Location is always explicit — set deterministically
         response.location_used = location
@@ -319,145 +509,308 @@ async def run_chronos(
         return response
         
     except Exception as e:
-        # Graceful error handling - NEVER crash during demo
+        # Graceful error handling - NEVER crash during demo.
+        # Known failure types return a preconstructed template; the rest
+        # cap the message since exceptions wrapping HTTP responses can
+        # carry kilobytes of payload, and we never format a traceback here.
+        template = _ERROR_TEMPLATES.get(type(e).__name__)
+        if template is not None:
+            return template
         return AgentError(
             error_type=type(e).__name__,
-            message=str(e),
+            message=str(e)[:256],
             fallback_available=True,
             suggestion="Try simplifying your request or check your API configuration."
         )
 
 
+# Static tail of every prompt, built once at import — only the date
+# bounds are substituted per call
+_TASK_TRAILER = (
+    "\n## Your Task\n"
+    "Follow the Per-Request Procedure from your instructions.\n"
+    "IMPORTANT: ALL step times MUST fall within {start_date} to {end_date} "
+    "(inclusive). Do NOT schedule outside this range."
+)
+
+
+# Specialized template for the dominant request shape (single day,
+# weather relevant) — all branches pre-resolved, one format_map per call
+_SINGLE_DAY_WEATHER_TEMPLATE = (
+    "## User Request\n{user_request}\n"
+    "\n## Provided Context (user-supplied — do NOT override)\n"
+    "- Location: {location}\n"
+    "- Date range: {date_display}\n"
+    "\n## Weather Relevance Assessment\n"
+    "- Relevant: {relevant}\n"
+    "- Confidence: {confidence}\n"
+    "- Outdoor activities: {outdoor}"
+    "{weather_block}"
+    "{trailer}"
+)
+
+
 def build_agent_prompt(
     user_request: str,
     location: str,
     start_date: str,
     end_date: str,
-    weather_data: Optional[WeatherCondition],
+    weather_by_day: list[WeatherCondition],
     weather_relevance: WeatherRelevance
 ) -> str:
     """Build the full prompt for the agent with all context."""
-    
+    # Fast path: single-day weather-relevant requests dominate demo
+    # traffic — fill the pre-resolved template in one format_map call
+    if start_date == end_date and len(weather_by_day) == 1:
+        return _SINGLE_DAY_WEATHER_TEMPLATE.format_map({
+            "user_request": user_request,
+            "location": location,
+            "date_display": f"{format_date_human(start_date)} ({start_date})",
+            "relevant": weather_relevance.is_relevant,
+            "confidence": f"{weather_relevance.confidence:.0%}",
+            "outdoor": weather_relevance.outdoor_activities,
+            "weather_block": _weather_block(weather_by_day[0]),
+            "trailer": _TASK_TRAILER.format(start_date=start_date, end_date=end_date),
+        })
+
     if start_date == end_date:
         date_display = f"{format_date_human(start_date)} ({start_date})"
     else:
         date_display = f"{format_date_human(start_date)} to {format_date_human(end_date)} ({start_date} to {end_date})"
-    
-    prompt_parts = [
-        f"## User Request\n{user_request}",
-        f"\n## Provided Context (user-supplied — do NOT override)",
-        f"- Location: {location}",
-        f"- Date range: {date_display}",
-    ]
-    
-    prompt_parts.append(f"\n## Weather Relevance Assessment")
-    prompt_parts.append(f"- Relevant: {weather_relevance.is_relevant}")
-    prompt_parts.append(f"- Confidence: {weather_relevance.confidence:.0%}")
-    prompt_parts.append(f"- Outdoor activities: {weather_relevance.outdoor_activities}")
-    
-    if weather_data:
-        risk_level = calculate_weather_risk(weather_data)
-        prompt_parts.append(f"\n## Weather Data for {weather_data.location} on {weather_data.forecast_date}")
-        prompt_parts.append(f"- Condition: {weather_data.condition}")
-        prompt_parts.append(f"- Temperature: {weather_data.temperature_celsius}°C")
-        prompt_parts.append(f"- Precipitation chance: {weather_data.precipitation_chance}%")
-        prompt_parts.append(f"- Wind speed: {weather_data.wind_speed_kmh} km/h")
-        prompt_parts.append(f"- Humidity: {weather_data.humidity_percent}%")
-        prompt_parts.append(f"- Calculated risk level: {risk_level.value}")
-        if weather_data.is_simulated:
-            prompt_parts.append("- **WARNING: This is ESTIMATED weather data (forecast unavailable for this date). Do NOT present these numbers as real. Clearly tell the user the forecast is an estimate.**")
-    
-    prompt_parts.append("\n## Your Task")
-    prompt_parts.append("FIRST: Perform the REALITY CHECK. Decide whether the activity is physically feasible at the location.")
-    prompt_parts.append("Fill in 'task_feasibility' BEFORE generating any plans.")
-    prompt_parts.append("If infeasible: set plan_a and plan_b to null, do NOT invent schedules or weather.")
-    prompt_parts.append("If feasible: generate a ChronosResponse with two plan options.")
-    prompt_parts.append("Plan A should be the original plan with honest risk assessment.")
-    prompt_parts.append("Plan B should be a weather-optimized alternative.")
-    prompt_parts.append("Include a decision trace explaining each key decision.")
-    prompt_parts.append("IMPORTANT: For every step, use 'time_from' and 'time_to' fields in ISO 8601 format (YYYY-MM-DDTHH:MM). NEVER use a combined time string.")
-    prompt_parts.append(f"IMPORTANT: ALL step times MUST fall within {start_date} to {end_date} (inclusive). Do NOT schedule outside this range.")
-    prompt_parts.append("IMPORTANT: Use ONLY the location provided above. Do NOT guess or change it.")
-    
-    return "\n".join(prompt_parts)
 
+    weather_blocks = "".join(_weather_block(w) for w in weather_by_day)
+
+    # Single f-string build — no per-line list appends + join churn
+    return (
+        f"## User Request\n{user_request}\n"
+        f"\n## Provided Context (user-supplied — do NOT override)\n"
+        f"- Location: {location}\n"
+        f"- Date range: {date_display}\n"
+        f"\n## Weather Relevance Assessment\n"
+        f"- Relevant: {weather_relevance.is_relevant}\n"
+        f"- Confidence: {weather_relevance.confidence:.0%}\n"
+        f"- Outdoor activities: {weather_relevance.outdoor_activities}"
+        f"{weather_blocks}"
+        f"{_TASK_TRAILER.format(start_date=start_date, end_date=end_date)}"
+    )
 
-# ──────────────────────────────────────────────────────────────────────────────
-# Fallback Plan Generator (for when agent fails)
-# ──────────────────────────────────────────────────────────────────────────────
 
-def generate_fallback_response(
+def _weather_block(weather_data: WeatherCondition) -> str:
+    """One prompt section describing a single day's forecast."""
+    risk_level = calculate_weather_risk(weather_data)
+    warning = (
+        "\n- **WARNING: This is ESTIMATED weather data (forecast unavailable for this date). "
+        "Do NOT present these numbers as real. Clearly tell the user the forecast is an estimate.**"
+        if weather_data.is_simulated
+        else ""
+    )
+    return (
+        f"\n\n## Weather Data for {weather_data.location} on {weather_data.forecast_date}\n"
+        f"- Condition: {weather_data.condition}\n"
+        f"- Temperature: {weather_data.temperature_celsius}°C\n"
+        f"- Precipitation chance: {weather_data.precipitation_chance}%\n"
+        f"- Wind speed: {weather_data.wind_speed_kmh} km/h\n"
+        f"- Humidity: {weather_data.humidity_percent}%\n"
+        f"- Calculated risk level: {risk_level.value}"
+        f"{warning}"
+    )
+
+
+def _build_indoor_response(
     user_request: str,
     location: str,
-    date: str,
-    weather_data: Optional[WeatherCondition]
+    start_date: str,
+    end_date: str,
+    weather_relevance: WeatherRelevance,
+    indoor_activities: list[str]
 ) -> ChronosResponse:
+    """Rule-based response for trivial indoor requests — no LLM call.
+
+    Only reached for single-activity, single-day asks with no planning
+    language, so the one-step template is an adequate answer; anything
+    richer goes to the model, and weather genuinely doesn't matter here.
     """
-    Generate a basic response when the LLM agent fails.
-    This ensures we always have something to show in demos.
-    """
-    risk_level = (
-        calculate_weather_risk(weather_data) 
-        if weather_data 
-        else RiskLevel.MEDIUM
-    )
-    
-    weather_relevance = WeatherRelevance(
-        is_relevant=True,
-        confidence=0.5,
-        explanation="Fallback mode - assuming weather may be relevant",
-        outdoor_activities=[]
-    )
-    
-    plan_a = PlanOption(
+    activities = ", ".join(indoor_activities)
+
+    plan_a = PlanOption.model_construct(
         name="Original Plan",
-        summary=f"Proceed with your plan as requested",
+        summary="Proceed with your plan as requested",
         steps=[
-            TaskStep(
+            TaskStep.model_construct(
                 order=1,
                 description=f"Proceed with: {user_request}",
-                time_from=f"{date}T09:00",
-                time_to=f"{date}T17:00",
-                weather_sensitive=True,
-                risk_note=f"Weather risk: {risk_level.value}"
+                time_from=f"{start_date}T10:00",
+                time_to=f"{start_date}T12:00",
+                location=None,
+                weather_sensitive=False,
+                risk_note=None,
             )
         ],
-        overall_risk=risk_level,
-        risk_explanation=format_risk_explanation(risk_level, weather_data) if weather_data else "Weather data unavailable",
-        recommended=risk_level == RiskLevel.LOW
+        overall_risk=RiskLevel.LOW,
+        risk_explanation=f"Indoor activity ({activities}) — weather does not significantly impact this plan",
+        recommended=True,
     )
-    
-    plan_b = PlanOption(
-        name="Weather-Conscious Alternative",
-        summary="Consider weather conditions when proceeding",
+
+    plan_b = PlanOption.model_construct(
+        name="Flexible Timing",
+        summary="Same plan with flexible scheduling — weather is not a constraint",
         steps=[
-            TaskStep(
+            TaskStep.model_construct(
                 order=1,
-                description="Check weather before leaving",
-                time_from=f"{date}T08:00",
-                time_to=f"{date}T08:30",
-                weather_sensitive=False
-            ),
-            TaskStep(
-                order=2,
-                description=f"Proceed with: {user_request}",
-                time_from=f"{date}T09:00",
-                time_to=f"{date}T17:00",
-                weather_sensitive=True,
-                risk_note="Have a backup plan ready"
+                description=f"Proceed with: {user_request} (any convenient time works)",
+                time_from=f"{start_date}T15:00",
+                time_to=f"{start_date}T17:00",
+                location=None,
+                weather_sensitive=False,
+                risk_note=None,
             )
         ],
-        overall_risk=RiskLevel.LOW if risk_level != RiskLevel.CRITICAL else RiskLevel.MEDIUM,
-        risk_explanation="Taking precautions reduces risk",
-        recommended=risk_level != RiskLevel.LOW
+        overall_risk=RiskLevel.LOW,
+        risk_explanation="Indoor activity — any time slot works regardless of weather",
+        recommended=False,
+    )
+
+    return ChronosResponse.model_construct(
+        original_request=user_request,
+        extracted_location=location,
+        start_date=start_date,
+        end_date=end_date,
+        location_used=location,
+        location_confidence=1.0,
+        task_feasibility=TaskFeasibility.model_construct(
+            feasible=True,
+            reason=f"Indoor activity ({activities}) — feasible at the given location",
+            suggestion=None,
+        ),
+        weather_relevance=weather_relevance,
+        weather_data=None,
+        plan_a=plan_a,
+        plan_b=plan_b,
+        decision_trace=[
+            DecisionPoint.model_construct(
+                decision="Skipped weather lookup",
+                reasoning="Activity appears to be primarily indoor or weather-independent",
+                data_used=None,
+            ),
+            DecisionPoint.model_construct(
+                decision="Skipped LLM call",
+                reasoning=f"Clearly indoor activity ({activities}) — served the rule-based template",
+                data_used=None,
+            ),
+        ],
+        agent_confidence=0.7,
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fallback Plan Generator (for when agent fails)
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Prebuilt at import so the fallback path only patches the handful of
+# dynamic fields instead of re-running full Pydantic validation on every
+# constant field each time the LLM fails.
+_FALLBACK_PLAN_A_TEMPLATE = PlanOption(
+    name="Original Plan",
+    summary="Proceed with your plan as requested",
+    steps=[
+        TaskStep(
+            order=1,
+            description="Proceed with your plan",
+            weather_sensitive=True,
+        )
+    ],
+    overall_risk=RiskLevel.MEDIUM,
+    risk_explanation="Weather data unavailable",
+    recommended=False,
+)
+
+_FALLBACK_PLAN_B_TEMPLATE = PlanOption(
+    name="Weather-Conscious Alternative",
+    summary="Consider weather conditions when proceeding",
+    steps=[
+        TaskStep(
+            order=1,
+            description="Check weather before leaving",
+            weather_sensitive=False,
+        ),
+        TaskStep(
+            order=2,
+            description="Proceed with your plan",
+            weather_sensitive=True,
+            risk_note="Have a backup plan ready",
+        ),
+    ],
+    overall_risk=RiskLevel.LOW,
+    risk_explanation="Taking precautions reduces risk",
+    recommended=True,
+)
+
+_FALLBACK_RELEVANCE_TEMPLATE = WeatherRelevance(
+    is_relevant=True,
+    confidence=0.5,
+    explanation="Fallback mode - assuming weather may be relevant",
+    outdoor_activities=[],
+)
+
+
+def generate_fallback_response(
+    user_request: str,
+    location: str,
+    date: str,
+    weather_data: Optional[WeatherCondition]
+) -> ChronosResponse:
+    """
+    Generate a basic response when the LLM agent fails.
+    This ensures we always have something to show in demos.
+    """
+    risk_level = (
+        calculate_weather_risk(weather_data)
+        if weather_data
+        else RiskLevel.MEDIUM
     )
+
+    weather_relevance = _FALLBACK_RELEVANCE_TEMPLATE.model_copy()
+
+    step_a = _FALLBACK_PLAN_A_TEMPLATE.steps[0].model_copy(update={
+        "description": f"Proceed with: {user_request}",
+        "time_from": f"{date}T09:00",
+        "time_to": f"{date}T17:00",
+        "risk_note": f"Weather risk: {risk_level.value}",
+    })
+    plan_a = _FALLBACK_PLAN_A_TEMPLATE.model_copy(update={
+        "steps": [step_a],
+        "overall_risk": risk_level,
+        "risk_explanation": (
+            format_risk_explanation(risk_level, weather_data)
+            if weather_data
+            else "Weather data unavailable"
+        ),
+        "recommended": risk_level == RiskLevel.LOW,
+    })
+
+    step_b1 = _FALLBACK_PLAN_B_TEMPLATE.steps[0].model_copy(update={
+        "time_from": f"{date}T08:00",
+        "time_to": f"{date}T08:30",
+    })
+    step_b2 = _FALLBACK_PLAN_B_TEMPLATE.steps[1].model_copy(update={
+        "description": f"Proceed with: {user_request}",
+        "time_from": f"{date}T09:00",
+        "time_to": f"{date}T17:00",
+    })
+    plan_b = _FALLBACK_PLAN_B_TEMPLATE.model_copy(update={
+        "steps": [step_b1, step_b2],
+        "overall_risk": RiskLevel.LOW if risk_level != RiskLevel.CRITICAL else RiskLevel.MEDIUM,
+        "recommended": risk_level != RiskLevel.LOW,
+    })
     
-    return ChronosResponse(
+    # Every field below is hand-crafted and known valid, so skip the full
+    # validator stack on this worst-case (LLM already failed) path
+    return ChronosResponse.model_construct(
         original_request=user_request,
         extracted_location=location,
         start_date=date,
         end_date=date,
-        task_feasibility=TaskFeasibility(
+        task_feasibility=TaskFeasibility.model_construct(
             feasible=True,
             reason="Fallback mode — feasibility not evaluated",
             suggestion=None
@@ -467,7 +820,7 @@ def generate_fallback_response(
         plan_a=plan_a,
         plan_b=plan_b,
         decision_trace=[
-            DecisionPoint(
+            DecisionPoint.model_construct(
                 decision="Used fallback planning",
                 reasoning="LLM agent unavailable, using rule-based planning",
                 data_used=None
@@ -11,51 +11,78 @@ Provides:
 
 import asyncio
 import base64
+import functools
+import html
+import re
+import string
 import threading
-from collections import defaultdict
+import time
+from concurrent.futures import TimeoutError as FuturesTimeout
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import groupby
 from pathlib import Path
 from typing import Optional
 
 import streamlit as st
 
-from agent import run_chronos
-from models import ChronosResponse, AgentError, RiskLevel, PlanOption
-from utils import get_risk_color, format_date_human, get_location_from_ip
+# NOTE: agent (and with it pydantic_ai + the Gemini client) is imported
+# lazily inside _cached_generate — pulling it in at module scope would add
+# its full import cost to every first paint, even for sessions that never
+# click Generate. models is lightweight and needed for isinstance checks.
+from models import ChronosResponse, AgentError, PlanOption
+from utils import format_date_human, get_location_from_ip
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Async helper — persistent loop that never closes
 # ──────────────────────────────────────────────────────────────────────────────
 
-_LOOP: asyncio.AbstractEventLoop | None = None
-_LOOP_THREAD: threading.Thread | None = None
+# Optional accelerator — uvloop exposes the same loop API with much lower
+# per-syscall I/O overhead. Fall back to the stdlib loop when not installed.
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
 
+@st.cache_resource(show_spinner=False)
 def _get_loop() -> asyncio.AbstractEventLoop:
     """Return a long-lived event loop running on a daemon thread.
 
-    The loop is created once and reused for every call, so libraries
-    that cache loop references (httpx, pydantic_ai) never see a closed loop.
+    Owned by st.cache_resource so Streamlit guarantees exactly one
+    loop+thread per process (shared across sessions and hot-reloads),
+    and libraries that cache loop references (httpx, pydantic_ai)
+    never see a closed loop.
     """
-    global _LOOP, _LOOP_THREAD
-    if _LOOP is None or _LOOP.is_closed():
-        _LOOP = asyncio.new_event_loop()
+    loop = _new_event_loop()
 
-        def _run_forever(loop: asyncio.AbstractEventLoop):
-            asyncio.set_event_loop(loop)
-            loop.run_forever()
+    def _run_forever():
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
 
-        _LOOP_THREAD = threading.Thread(target=_run_forever, args=(_LOOP,), daemon=True)
-        _LOOP_THREAD.start()
-    return _LOOP
+    threading.Thread(target=_run_forever, daemon=True).start()
+    return loop
 
 
-def _run_async(coro):
-    """Submit an async coroutine to the persistent background loop and wait."""
+def _run_async(coro, progress_cb=None, poll_interval: float = 0.25):
+    """Submit an async coroutine to the persistent background loop and wait.
+
+    Without a callback this blocks until done, as before. With one, the
+    wait polls in short slices and invokes progress_cb between them so the
+    script thread can refresh UI feedback (e.g. an st.status label) while
+    the agent works.
+    """
     loop = _get_loop()
     future = asyncio.run_coroutine_threadsafe(coro, loop)
-    return future.result()  # blocks until done
+    if progress_cb is None:
+        return future.result()  # blocks until done
+    while True:
+        try:
+            return future.result(timeout=poll_interval)
+        except FuturesTimeout:
+            progress_cb()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -74,452 +101,215 @@ st.set_page_config(
 # Custom CSS
 # ──────────────────────────────────────────────────────────────────────────────
 
-st.markdown(
-    """
-<style>
-    /* Import modern fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Poppins:wght@400;500;600;700&display=swap');
-    
-    /* Global styles and variables */
-    :root {
-        --primary-color: #6366f1;
-        --primary-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        --secondary-gradient: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        --success-gradient: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        --warning-gradient: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        --danger-gradient: linear-gradient(135deg, #ff758c 0%, #ff7eb3 100%);
-        --card-shadow: 0 10px 25px rgba(0,0,0,0.1);
-        --card-shadow-hover: 0 20px 40px rgba(0,0,0,0.15);
-        --border-radius: 16px;
-        --text-primary: #1a202c;
-        --text-secondary: #718096;
-        --background: #f7fafc;
-    }
-    
-    /* Hide Streamlit default elements */
-    .css-1d391kg, .css-1v3fvcr, .css-18e3th9, .css-1dp5vir, .css-uf99v8 {
-        display: none;
-    }
-    
-    /* Main container styling */
-    .main .block-container {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        min-height: 100vh;
-        padding: 2rem 1rem;
-    }
-    
-    /* App container */
-    .app-container {
-        background: white;
-        border-radius: 24px;
-        padding: 2rem;
-        margin: 0 auto;
-        max-width: 1200px;
-        box-shadow: 0 25px 50px rgba(0,0,0,0.1);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255,255,255,0.2);
-    }
-    
-    /* Header styles */
-    .main-header {
-        font-family: 'Poppins', sans-serif;
-        font-size: 3.5rem;
-        font-weight: 700;
-        background: var(--primary-gradient);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 0.5rem;
-        line-height: 1.2;
-    }
-    
-    .sub-header {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.2rem;
-        color: var(--text-secondary);
-        text-align: center;
-        margin-bottom: 2.5rem;
-        font-weight: 400;
-    }
-    
-    /* Logo container */
-    .logo-container {
-        display: flex;
-        justify-content: center;
-        margin-bottom: 1.5rem;
-        animation: fadeInScale 1s ease-out;
-    }
-    
-    .logo-container img {
-        width: 140px;
-        height: 140px;
-        object-fit: cover;
-        border-radius: 50%;
-        border: 4px solid transparent;
-        background: var(--primary-gradient);
-        padding: 4px;
-        transition: transform 0.3s ease;
-    }
-    
-    .logo-container img:hover {
-        transform: scale(1.05) rotate(5deg);
-    }
-    
-    /* Section headers */
-    h3 {
-        font-family: 'Poppins', sans-serif;
-        color: var(--text-primary);
-        font-weight: 600;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-        font-size: 1.3rem;
-    }
-    
-    /* Input cards */
-    .input-card {
-        background: white;
-        border-radius: var(--border-radius);
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid #e2e8f0;
-        transition: all 0.3s ease;
-    }
-    
-    .input-card:hover {
-        box-shadow: var(--card-shadow-hover);
-        transform: translateY(-2px);
-    }
-    
-    /* Weather box - enhanced */
-    .weather-box {
-        background: var(--success-gradient);
-        color: white;
-        border-radius: var(--border-radius);
-        padding: 2rem;
-        margin: 1.5rem 0;
-        box-shadow: var(--card-shadow);
-        position: relative;
-        overflow: hidden;
-        animation: slideInUp 0.6s ease-out;
-    }
-    
-    .weather-box::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -50%;
-        width: 100%;
-        height: 100%;
-        background: rgba(255,255,255,0.1);
-        border-radius: 50%;
-        animation: float 6s ease-in-out infinite;
-    }
-    
-    .weather-box strong {
-        font-size: 1.1rem;
-        margin-bottom: 0.5rem;
-        display: block;
-    }
-    
-    /* Suggestion box - enhanced */
-    .suggestion-box {
-        background: linear-gradient(135deg, #f093fb 10%, #f5576c 100%);
-        color: white;
-        border-radius: var(--border-radius);
-        padding: 2rem;
-        margin: 1.5rem 0;
-        box-shadow: var(--card-shadow);
-        position: relative;
-        animation: slideInRight 0.6s ease-out;
-    }
-    
-    .suggestion-box::after {
-        content: '✨';
-        position: absolute;
-        top: 1rem;
-        right: 1rem;
-        font-size: 1.5rem;
-        animation: pulse 2s infinite;
-    }
-    
-    /* Date headers */
-    .date-header {
-        font-family: 'Poppins', sans-serif;
-        font-size: 1.2rem;
-        font-weight: 600;
-        color: var(--primary-color);
-        margin-top: 1.5rem;
-        margin-bottom: 1rem;
-        padding: 0.75rem 1.5rem;
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
-        border-radius: var(--border-radius);
-        border-left: 4px solid var(--primary-color);
-    }
-    
-    /* Plan cards */
-    .plan-card {
-        background: white;
-        border-radius: var(--border-radius);
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid #e2e8f0;
-        transition: all 0.3s ease;
-        animation: fadeInUp 0.5s ease-out;
-    }
-    
-    .plan-card:hover {
-        box-shadow: var(--card-shadow-hover);
-        transform: translateY(-2px);
-    }
-    
-    /* Risk indicators */
-    .risk-low { color: #10b981; font-weight: 600; }
-    .risk-medium { color: #f59e0b; font-weight: 600; }
-    .risk-high { color: #ef4444; font-weight: 600; }
-    
-    /* Task steps styling */
-    .task-step {
-        background: #f8fafc;
-        border-radius: 12px;
-        padding: 1rem 1.25rem;
-        margin: 0.75rem 0;
-        border-left: 4px solid var(--primary-color);
-        transition: all 0.3s ease;
-    }
-    
-    .task-step:hover {
-        background: #f1f5f9;
-        transform: translateX(4px);
-    }
-    
-    /* Buttons Enhancement */
-    .stButton > button {
-        background: var(--primary-gradient) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 0.75rem 2rem !important;
-        font-weight: 600 !important;
-        font-family: 'Inter', sans-serif !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4) !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.6) !important;
-    }
-    
-    .stButton > button:active {
-        transform: translateY(0px) !important;
-    }
-    
-    /* Input field styling */
-    .stTextInput > div > div > input, .stTextArea > div > div > textarea {
-        border-radius: 12px !important;
-        border: 2px solid #e2e8f0 !important;
-        font-family: 'Inter', sans-serif !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus, .stTextArea > div > div > textarea:focus {
-        border-color: var(--primary-color) !important;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
-    }
-    
-    /* Date input styling */
-    .stDateInput > div > div > input {
-        border-radius: 12px !important;
-        border: 2px solid #e2e8f0 !important;
-        font-family: 'Inter', sans-serif !important;
-    }
-    
-    /* Metrics enhancement */
-    .metric-card {
-        background: white;
-        border-radius: var(--border-radius);
-        padding: 1.5rem;
-        text-align: center;
-        box-shadow: var(--card-shadow);
-        border: 1px solid #e2e8f0;
-        transition: all 0.3s ease;
-        animation: fadeInUp 0.4s ease-out;
-    }
-    
-    .metric-card:hover {
-        box-shadow: var(--card-shadow-hover);
-        transform: translateY(-2px);
-    }
-    
-    /* Animations */
-    @keyframes fadeInScale {
-        from {
-            opacity: 0;
-            transform: scale(0.8);
-        }
-        to {
-            opacity: 1;
-            transform: scale(1);
-        }
-    }
-    
-    @keyframes slideInUp {
-        from {
-            opacity: 0;
-            transform: translateY(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes slideInRight {
-        from {
-            opacity: 0;
-            transform: translateX(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translateY(0px) rotate(0deg); }
-        50% { transform: translateY(-10px) rotate(5deg); }
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; transform: scale(1); }
-        50% { opacity: 0.8; transform: scale(1.1); }
-    }
-    
-    /* Footer styling */
-    .footer {
-        text-align: center;
-        color: var(--text-secondary);
-        font-size: 0.9rem;
-        margin-top: 3rem;
-        padding: 2rem 0;
-        border-top: 1px solid #e2e8f0;
-        font-family: 'Inter', sans-serif;
-        background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-        border-radius: var(--border-radius);
-    }
-    
-    /* Responsive design */
-    @media (max-width: 768px) {
-        .main-header {
-            font-size: 2.5rem;
-        }
-        
-        .app-container {
-            margin: 0.5rem;
-            padding: 1rem;
-        }
-        
-        .logo-container img {
-            width: 100px;
-            height: 100px;
-        }
-    }
-    
-    /* Loading spinner enhancement */
-    .stSpinner > div > div {
-        border-color: var(--primary-color) !important;
-    }
-    
-    /* Success/Warning/Error message styling */
-    .stAlert {
-        border-radius: var(--border-radius) !important;
-        border: none !important;
-        box-shadow: var(--card-shadow) !important;
-    }
-    
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        background: #f8fafc !important;
-        border-radius: 12px !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Column spacing */
-    .element-container {
-        margin-bottom: 1rem;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+# The stylesheet lives in assets/chronos.css; the disk read is cached per
+# process. st.markdown must still run every rerun because Streamlit drops
+# elements that a script pass doesn't re-emit — gating the injection behind
+# a session flag would unstyle the page on the next rerun.
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    return (Path(__file__).parent / "assets" / "chronos.css").read_text()
+
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Session State — persist every input and all results
 # ──────────────────────────────────────────────────────────────────────────────
 
-_DEFAULTS = {
-    "response": None,
-    "task_input": "",
-    "location_city": "",
-    "location_state": "",
-    "location_country": "",
-    # Widget keys — Streamlit reads value from these directly
-    "city_widget": "",
-    "state_widget": "",
-    "country_widget": "",
-    "start_date_widget": datetime.now().date() + timedelta(days=1),
-    "end_date_widget": datetime.now().date() + timedelta(days=1),
-    "saved_plans": [],          # list[dict] — snapshots of past results
-    "ip_location": None,        # str | None — cached IP detection result
-    "ip_location_used": False,  # whether the user accepted the detected location
-}
-
-for key, default in _DEFAULTS.items():
-    if key not in st.session_state:
-        st.session_state[key] = default
+# Computed once per script pass — reused by the defaults below and both
+# date pickers instead of four separate datetime.now() calls per rerun.
+_TODAY = datetime.now().date()
+_TOMORROW = _TODAY + timedelta(days=1)
+
+# Sentinel short-circuit: after the first pass of a session the whole
+# defaults block — including the dict construction and the date-default
+# evaluation — is skipped, leaving one membership test per rerun. Building
+# the dict here (not at a cached/module constant) also keeps the date
+# defaults fresh for sessions started after midnight and gives every
+# session its own saved-plans deque.
+if "_state_inited" not in st.session_state:
+    _defaults = {
+        "response": None,
+        "task_input": "",
+        "location_city": "",
+        "location_state": "",
+        "location_country": "",
+        # Widget keys — Streamlit reads value from these directly
+        "city_widget": "",
+        "state_widget": "",
+        "country_widget": "",
+        "start_date_widget": _TOMORROW,
+        "end_date_widget": _TOMORROW,
+        "saved_plans": deque(maxlen=20),  # newest-first snapshots of past results
+        "saved_plan_seq": 0,        # monotonic id source for snapshot widget keys
+        "ip_location": None,        # str | None — cached IP detection result
+        "ip_location_used": False,  # whether the user accepted the detected location
+    }
+    for key, default in _defaults.items():
+        st.session_state.setdefault(key, default)
+    st.session_state["_state_inited"] = True
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+class _AgentRunFailed(Exception):
+    """Internal: raised so failed runs are surfaced but never cached."""
+
+    def __init__(self, error: AgentError):
+        super().__init__(error.message)
+        self.error = error
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_generate(
+    user_request: str,
+    location: str,
+    start_date: str,
+    end_date: str,
+    _progress_cb=None,
+) -> ChronosResponse:
+    """Run the agent pipeline, memoized on the exact inputs.
+
+    Resubmitting identical inputs (the common demo pattern) skips the
+    multi-second LLM + weather round trip entirely. Errors are raised
+    instead of returned so they never get pinned in the cache. The
+    leading underscore keeps the progress callback out of the cache key.
+    """
+    from agent import run_chronos  # deferred: heavy LLM/HTTP import stack
+
+    response = _run_async(
+        run_chronos(
+            user_request=user_request,
+            location=location,
+            start_date=start_date,
+            end_date=end_date,
+        ),
+        progress_cb=_progress_cb,
+    )
+    if isinstance(response, AgentError):
+        raise _AgentRunFailed(response)
+    return response
+
+
+def _escape_for_display(response: ChronosResponse) -> ChronosResponse:
+    """Return a copy with user/LLM-originated display fields HTML-escaped.
+
+    Every render path splices these strings into unsafe_allow_html
+    markdown, so escaping once here (when the response is stored) is both
+    cheaper than escaping inside each f-string on every rerun and closes
+    the hole of raw LLM output reaching the page as markup.
+    """
+    esc = html.escape
+
+    def _opt(value: Optional[str]) -> Optional[str]:
+        return esc(value) if value else value
+
+    def _plan(plan: Optional[PlanOption]) -> Optional[PlanOption]:
+        if plan is None:
+            return None
+        return plan.model_copy(update={
+            "name": esc(plan.name),
+            "summary": esc(plan.summary),
+            "risk_explanation": esc(plan.risk_explanation),
+            "steps": [
+                step.model_copy(update={
+                    "description": esc(step.description),
+                    "location": _opt(step.location),
+                    "risk_note": _opt(step.risk_note),
+                })
+                for step in plan.steps
+            ],
+        })
+
+    return response.model_copy(update={
+        "original_request": esc(response.original_request),
+        "extracted_location": _opt(response.extracted_location),
+        "task_feasibility": response.task_feasibility.model_copy(update={
+            "reason": esc(response.task_feasibility.reason),
+            "suggestion": _opt(response.task_feasibility.suggestion),
+        }),
+        "plan_a": _plan(response.plan_a),
+        "plan_b": _plan(response.plan_b),
+        "decision_trace": [
+            point.model_copy(update={
+                "decision": esc(point.decision),
+                "reasoning": esc(point.reasoning),
+                "data_used": _opt(point.data_used),
+            })
+            for point in response.decision_trace
+        ],
+    })
+
+
+@functools.lru_cache(maxsize=32)
+def _response_from_json(payload: str) -> ChronosResponse:
+    """Rebuild a saved ChronosResponse from its JSON snapshot.
+
+    Memoized so an open history entry revalidates once, not per rerun."""
+    return ChronosResponse.model_validate_json(payload)
+
+
+@st.cache_data(show_spinner=False)
+def _logo_data_uri(path: str) -> Optional[str]:
+    """Read and base64-encode the logo once per process — the file never
+    changes at runtime, so reruns shouldn't repeat the disk read + encode."""
+    p = Path(path)
+    if not p.exists():
+        return None
+    return base64.b64encode(p.read_bytes()).decode()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_get_location_from_ip() -> Optional[tuple[str, str, str]]:
+    """IP geolocation as a (city, state, country) tuple, cached for an hour.
+
+    Repeated 'Detect my location' clicks reuse the result instead of
+    re-hitting the free-tier services, and splitting the detector's
+    comma-joined string once here means the accept handler never has to
+    re-parse it."""
+    raw = get_location_from_ip()
+    if not raw:
+        return None
+    parts = [p.strip() for p in raw.split(",")]
+    parts += ["", "", ""]
+    return parts[0], parts[1], parts[2]
+
+@functools.lru_cache(maxsize=512)
 def _format_time_range(time_from: Optional[str], time_to: Optional[str]) -> str:
-    """Format ISO 8601 from/to into '8:00 AM – 10:00 AM'."""
+    """Format ISO 8601 from/to into '8:00 AM – 10:00 AM'.
+
+    Slices HH/MM straight out of the 'YYYY-MM-DDTHH:MM' string instead of
+    round-tripping through datetime.fromisoformat + strftime — this runs
+    once per step on every rerun that shows a plan.
+    """
     if not time_from and not time_to:
         return ""
     try:
         parts: list[str] = []
         for raw in (time_from, time_to):
             if raw:
-                dt = datetime.fromisoformat(raw)
-                parts.append(dt.strftime("%I:%M %p").lstrip("0"))
+                hour = int(raw[11:13])
+                minute = raw[14:16]
+                am_pm = "AM" if hour < 12 else "PM"
+                parts.append(f"{hour % 12 or 12}:{minute} {am_pm}")
             else:
                 parts.append("?")
         return f" ({parts[0]} – {parts[1]})"
-    except (ValueError, TypeError):
+    except (ValueError, IndexError):
         return f" ({time_from} – {time_to})"
 
 
 def _build_location_string(city: str, state: str, country: str) -> str:
     """Combine city/state/country into a single location string."""
-    parts = [p.strip() for p in (city, state, country) if p and p.strip()]
-    return ", ".join(parts)
+    if not (city or state or country):
+        return ""
+    return ", ".join(p for p in (city.strip(), state.strip(), country.strip()) if p)
 
 
+@functools.lru_cache(maxsize=512)
 def _extract_date_from_iso(iso_str: Optional[str]) -> Optional[str]:
     """Extract YYYY-MM-DD from an ISO datetime string like '2025-07-10T09:00'."""
     if not iso_str:
@@ -527,158 +317,274 @@ def _extract_date_from_iso(iso_str: Optional[str]) -> Optional[str]:
     return iso_str[:10] if len(iso_str) >= 10 else None
 
 
-def _group_steps_by_date(steps: list) -> dict[str, list]:
-    """Group TaskStep objects by their date (from time_from)."""
-    grouped: dict[str, list] = defaultdict(list)
-    for step in steps:
-        date_key = _extract_date_from_iso(step.time_from) or "Unscheduled"
-        grouped[date_key].append(step)
-    return dict(grouped)
+def _group_steps_by_date(steps: list) -> list[tuple[str, list]]:
+    """Group TaskStep objects by date (from time_from), in date order.
+
+    Single pass with itertools.groupby over a date-sorted copy — no
+    intermediate dict, and the caller gets the groups already ordered
+    (unscheduled steps sort last).
+    """
+    extract = _extract_date_from_iso
+    steps_sorted = sorted(steps, key=lambda s: extract(s.time_from) or "~")
+    return [
+        (date_key, list(group))
+        for date_key, group in groupby(
+            steps_sorted, key=lambda s: extract(s.time_from) or "Unscheduled"
+        )
+    ]
+
+
+@st.cache_data(
+    max_entries=64,
+    show_spinner=False,
+    hash_funcs={
+        PlanOption: lambda p: (
+            p.name,
+            p.summary,
+            # Every rendered step field — template-built plans share
+            # constant names and times across different requests, and a
+            # fingerprint that omits any displayed field can serve one
+            # request's cached steps for another
+            tuple(
+                (
+                    s.order,
+                    s.time_from,
+                    s.time_to,
+                    s.description,
+                    s.location,
+                    s.risk_note,
+                    s.weather_sensitive,
+                )
+                for s in p.steps
+            ),
+        )
+    },
+)
+def _grouped_steps(plan: PlanOption) -> list[tuple[str, list]]:
+    """Grouping for a given plan, computed once instead of every rerun.
+
+    Plans are immutable once generated, so a structural fingerprint over
+    the fields that appear in the output is a safe cache key.
+    """
+    return _group_steps_by_date(plan.steps)
+
+
+def _trace_html(trace: list) -> str:
+    """Render the decision trace as one HTML string (single delta message)."""
+    parts: list[str] = []
+    for i, point in enumerate(trace, start=1):
+        data_line = (
+            f'<br><small style="color: #718096;">📊 Data: {point.data_used}</small>'
+            if point.data_used
+            else ""
+        )
+        parts.append(
+            f'<div class="task-step">'
+            f'<strong>🧠 Decision {i}:</strong> {point.decision}'
+            f'<br><small style="color: #718096;">💭 {point.reasoning}</small>'
+            f'{data_line}'
+            f'</div>'
+        )
+    return "".join(parts)
+
+
+# Risk-level icons for plan cards, hoisted so display_plan doesn't rebuild
+# the dict per call
+_RISK_ICONS = {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴"}
 
 
 def display_plan(plan: PlanOption, multi_day: bool = False):
-    """Render a plan's steps, grouped by date when multi-day."""
-    st.markdown('<div class="plan-card">', unsafe_allow_html=True)
-    st.markdown(f"### 📋 {plan.summary}")
-
-    # Enhanced risk indicator with icons
-    risk_icons = {
-        "LOW": "🟢",
-        "MEDIUM": "🟡", 
-        "HIGH": "🔴"
-    }
+    """Render a plan's steps, grouped by date when multi-day.
+
+    The whole card is pure HTML, so it is concatenated and emitted as a
+    single st.markdown call — one delta message per plan instead of one
+    per heading, risk line, date header and step group.
+    """
     risk_level = plan.overall_risk.value.upper()
-    risk_icon = risk_icons.get(risk_level, "⚪")
+    risk_icon = _RISK_ICONS.get(risk_level, "⚪")
     risk_class = f"risk-{plan.overall_risk.value.lower()}"
-    
-    st.markdown(
+
+    parts = [
+        '<div class="plan-card">',
+        f'<h3>📋 {plan.summary}</h3>',
         f'<div class="{risk_class}">{risk_icon} Risk Level: <strong>{risk_level}</strong></div>',
-        unsafe_allow_html=True
-    )
-    st.markdown(f'<p style="color: #718096; margin-top: 0.5rem;">{plan.risk_explanation}</p>', unsafe_allow_html=True)
+        f'<p style="color: #718096; margin-top: 0.5rem;">{plan.risk_explanation}</p>',
+    ]
 
     if multi_day:
-        grouped = _group_steps_by_date(plan.steps)
-        for date_key in sorted(grouped.keys()):
+        for date_key, day_steps in _grouped_steps(plan):
             if date_key == "Unscheduled":
-                st.markdown('<p class="date-header">📌 Unscheduled Tasks</p>', unsafe_allow_html=True)
+                parts.append('<p class="date-header">📌 Unscheduled Tasks</p>')
             else:
-                st.markdown(
-                    f'<p class="date-header">📅 {format_date_human(date_key)}</p>',
-                    unsafe_allow_html=True,
-                )
-            for step in grouped[date_key]:
-                _render_step(step)
+                parts.append(f'<p class="date-header">📅 {format_date_human(date_key)}</p>')
+            parts.append(_steps_html(day_steps))
     else:
-        for step in plan.steps:
-            _render_step(step)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+        parts.append(_steps_html(plan.steps))
 
+    parts.append('</div>')
+    st.markdown("".join(parts), unsafe_allow_html=True)
 
-def _render_step(step):
-    """Render a single TaskStep with enhanced styling."""
-    time_str = _format_time_range(step.time_from, step.time_to)
-    loc_str = f" 📍 {step.location}" if step.location else ""
-    
-    st.markdown(
-        f'<div class="task-step">'
-        f'<strong>⭐ Step {step.order}:</strong> {step.description}'
-        f'<br><small style="color: #718096;">🕒 {time_str}{loc_str}</small>'
-        f'</div>',
-        unsafe_allow_html=True
-    )
-    
-    if step.risk_note:
-        st.markdown(
-            f'<div style="background: #fef3cd; border-left: 4px solid #f59e0b; padding: 0.5rem 1rem; '
-            f'margin: 0.25rem 0 0.75rem 0; border-radius: 8px; font-size: 0.85rem;">'
-            f'⚠️ <strong>Note:</strong> {step.risk_note}'
-            f'</div>',
-            unsafe_allow_html=True
+
+def _steps_html(steps) -> str:
+    """Render a group of TaskSteps as one HTML string.
+
+    Concatenating here and emitting a single st.markdown per date group
+    keeps the delta queue at one entry per group instead of one (or two,
+    with a risk note) per step.
+    """
+    parts: list[str] = []
+    append = parts.append
+    for step in steps:
+        # Pydantic attribute access is pricier than plain attrs — read each
+        # field once per step in this loop
+        location = step.location
+        risk_note = step.risk_note
+        time_str = _format_time_range(step.time_from, step.time_to)
+        loc_str = f" 📍 {location}" if location else ""
+        append(
+            f'<div class="task-step">'
+            f'<strong>⭐ Step {step.order}:</strong> {step.description}'
+            f'<br><small style="color: #718096;">🕒 {time_str}{loc_str}</small>'
+            f'</div>'
         )
+        if risk_note:
+            append(
+                f'<div style="background: #fef3cd; border-left: 4px solid #f59e0b; padding: 0.5rem 1rem; '
+                f'margin: 0.25rem 0 0.75rem 0; border-radius: 8px; font-size: 0.85rem;">'
+                f'⚠️ <strong>Note:</strong> {risk_note}'
+                f'</div>'
+            )
+    return "".join(parts)
+
+
+# Weather-condition icons, hoisted to module scope with a compiled
+# alternation so each render is one C-level regex search instead of a
+# dict rebuild plus a Python substring scan. Longest phrases first so
+# 'light rain' matches its own icon rather than plain 'rain'.
+_WEATHER_ICONS = {
+    'partly cloudy': '⛅',
+    'light rain': '🌦️',
+    'heavy rain': '🌧️',
+    'overcast': '☁️',
+    'cloudy': '☁️',
+    'clear': '☀️',
+    'sunny': '☀️',
+    'storm': '⛈️',
+    'rain': '🌧️',
+    'snow': '❄️',
+    'fog': '🌫️',
+    'mist': '🌫️',
+}
+_WEATHER_ICON_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_WEATHER_ICONS, key=len, reverse=True))
+)
 
 
-def display_weather_info(weather):
-    """Enhanced weather info box with icons and better styling."""
-    # Weather condition icons
-    weather_icons = {
-        'clear': '☀️',
-        'sunny': '☀️',
-        'partly cloudy': '⛅',
-        'cloudy': '☁️',
-        'overcast': '☁️',
-        'rain': '🌧️',
-        'light rain': '🌦️',
-        'heavy rain': '🌧️',
-        'snow': '❄️',
-        'storm': '⛈️',
-        'fog': '🌫️',
-        'mist': '🌫️'
-    }
-    
-    condition_lower = weather.condition.lower()
-    weather_icon = '🌤️'  # default
-    for key, icon in weather_icons.items():
-        if key in condition_lower:
-            weather_icon = icon
-            break
-    
-    sim_badge = '<span style="background: rgba(245, 158, 11, 0.2); color: #d97706; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.75rem; margin-left: 0.5rem;">🔮 Simulated</span>' if weather.is_simulated else ''
-    
-    st.markdown(
-        f"""
+# Static weather-box markup built once; display_weather_info only
+# substitutes the handful of per-forecast fields on each render.
+_WEATHER_BOX_TPL = string.Template(
+    """
     <div class="weather-box">
         <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-            <strong style="font-size: 1.2rem;">{weather_icon} Weather Forecast</strong>
-            {sim_badge}
+            <strong style="font-size: 1.2rem;">$icon Weather Forecast</strong>
+            $sim_badge
         </div>
-        
+
         <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(120px, 1fr)); gap: 1rem; margin-bottom: 1rem;">
             <div style="text-align: center;">
                 <div style="font-size: 0.8rem; opacity: 0.8;">📍 Location</div>
-                <div style="font-weight: 600;">{weather.location}</div>
+                <div style="font-weight: 600;">$location</div>
             </div>
             <div style="text-align: center;">
                 <div style="font-size: 0.8rem; opacity: 0.8;">📅 Date</div>
-                <div style="font-weight: 600;">{format_date_human(weather.forecast_date)}</div>
+                <div style="font-weight: 600;">$date</div>
             </div>
         </div>
-        
+
         <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(100px, 1fr)); gap: 1rem; text-align: center;">
             <div>
                 <div style="font-size: 0.8rem; opacity: 0.8;">☁️ Condition</div>
-                <div style="font-weight: 600;">{weather.condition.title()}</div>
+                <div style="font-weight: 600;">$condition</div>
             </div>
             <div>
                 <div style="font-size: 0.8rem; opacity: 0.8;">🌡️ Temperature</div>
-                <div style="font-weight: 600;">{weather.temperature_celsius}°C</div>
+                <div style="font-weight: 600;">$temp°C</div>
             </div>
             <div>
                 <div style="font-size: 0.8rem; opacity: 0.8;">🌧️ Rain Chance</div>
-                <div style="font-weight: 600;">{weather.precipitation_chance}%</div>
+                <div style="font-weight: 600;">$precip%</div>
             </div>
             <div>
                 <div style="font-size: 0.8rem; opacity: 0.8;">💨 Wind Speed</div>
-                <div style="font-weight: 600;">{weather.wind_speed_kmh} km/h</div>
+                <div style="font-weight: 600;">$wind km/h</div>
             </div>
         </div>
     </div>
-    """,
+    """
+)
+
+
+def display_weather_info(weather):
+    """Enhanced weather info box with icons and better styling."""
+    match = _WEATHER_ICON_RE.search(weather.condition.lower())
+    weather_icon = _WEATHER_ICONS[match.group(0)] if match else '🌤️'
+    
+    sim_badge = '<span style="background: rgba(245, 158, 11, 0.2); color: #d97706; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.75rem; margin-left: 0.5rem;">🔮 Simulated</span>' if weather.is_simulated else ''
+
+    st.markdown(
+        _WEATHER_BOX_TPL.substitute(
+            icon=weather_icon,
+            sim_badge=sim_badge,
+            location=weather.location,
+            date=format_date_human(weather.forecast_date),
+            condition=weather.condition.title(),
+            temp=weather.temperature_celsius,
+            precip=weather.precipitation_chance,
+            wind=weather.wind_speed_kmh,
+        ),
         unsafe_allow_html=True,
     )
 
 
 def _save_plan(response: ChronosResponse):
     """Snapshot the current response into saved_plans."""
+    request = response.original_request
+
+    # A repeat submit with identical inputs returns the cached response —
+    # same generated_at — so don't stack an exact duplicate on top
+    plans = st.session_state.saved_plans
+    if plans and plans[0]["generated_at"] == response.generated_at \
+            and plans[0]["request"] == request:
+        return
+
+    location = response.extracted_location or response.location_used or "—"
+    dates = f"{response.start_date or '?'} – {response.end_date or '?'}"
+    preview = request[:50] + "..." if len(request) > 50 else request
+    st.session_state.saved_plan_seq += 1
     snapshot = {
-        "request": response.original_request,
-        "location": response.extracted_location or response.location_used or "—",
-        "dates": f"{response.start_date or '?'} – {response.end_date or '?'}",
+        # generated_at is only second-precision and cached responses reuse
+        # it, so widget keys hang off this session-unique id instead
+        "id": st.session_state.saved_plan_seq,
+        "request": request,
+        "location": location,
+        "dates": dates,
+        # Snapshots are immutable, so the expander label is formatted once
+        # here instead of per snapshot per rerun in the history loop
+        "label": f"🗂️ {preview} • 📍 {location} • 📅 {dates}",
         "generated_at": response.generated_at,
-        "response": response,
+        # Stored as one compact JSON string rather than the live pydantic
+        # tree — cheap to hold in session state, reconstituted only when a
+        # history entry is actually opened
+        "response_json": response.model_dump_json(),
+        # Computed once at save time so the history loop doesn't redo the
+        # date comparison for every snapshot on every rerun
+        "multi_day": bool(
+            response.start_date
+            and response.end_date
+            and response.start_date != response.end_date
+        ),
     }
-    st.session_state.saved_plans.insert(0, snapshot)
+    st.session_state.saved_plans.appendleft(snapshot)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -686,43 +592,38 @@ def _save_plan(response: ChronosResponse):
 # ──────────────────────────────────────────────────────────────────────────────
 
 # Logo and Header - wrapped in app container
-_logo_path = Path(__file__).parent / "assets" / "image.png"
-logo_html = ""
-if _logo_path.exists():
-    _logo_b64 = base64.b64encode(_logo_path.read_bytes()).decode()
-    logo_html = f'<div class="logo-container"><img src="data:image/png;base64,{_logo_b64}" alt="Chronos logo"></div>'
-
-st.markdown(
-    f'''
+@st.cache_data(show_spinner=False)
+def _header_html() -> str:
+    """Assemble the header markup once per process — logo bytes and copy
+    never change at runtime, so reruns just re-emit the cached string.
+    (The st.markdown itself must still run every pass: Streamlit drops
+    elements a rerun doesn't re-emit, so session-flag gating would blank
+    the header on the next interaction.)"""
+    logo_b64 = _logo_data_uri(str(Path(__file__).parent / "assets" / "image.png"))
+    logo_html = (
+        f'<div class="logo-container"><img src="data:image/png;base64,{logo_b64}" alt="Chronos logo"></div>'
+        if logo_b64
+        else ""
+    )
+    return f'''
     <div class="app-container">
         {logo_html}
         <p class="main-header">Chronos</p>
         <p class="sub-header">🌤️ Your Weather-Adaptive Planning Assistant</p>
     </div>
-    ''',
-    unsafe_allow_html=True,
-)
+    '''
+
+
+st.markdown(_header_html(), unsafe_allow_html=True)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Input Form
 # ──────────────────────────────────────────────────────────────────────────────
 
-#st.markdown('<div class="app-container" style="margin-top: 1rem;"><div class="input-card">', unsafe_allow_html=True)
-st.markdown("### 📝 What are you planning?")
-
-user_input = st.text_area(
-    "Describe your plan",
-    value=st.session_state.task_input,
-    placeholder="✨ e.g., Plan a beach day with friends, organize a hiking trip, arrange a garden party…",
-    height=90,
-    label_visibility="collapsed",
-    key="task_input_widget",
-)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# ── Location: city / state / country + auto-detect ────────────────────────
+# ── Location auto-detect ──────────────────────────────────────────────────
+# Lives OUTSIDE the form below: regular buttons aren't allowed inside
+# st.form, and the detect/confirm flow needs its immediate reruns.
 
-#st.markdown('<div class="input-card">', unsafe_allow_html=True)
 st.markdown("### 📍 Location")
 
 # Auto-detect button — only runs once, caches result
@@ -730,7 +631,7 @@ detect_col, spacer_col = st.columns([1, 3])
 with detect_col:
     if st.button("🎯 Detect my location", type="secondary"):
         with st.spinner("🔍 Detecting your location…"):
-            detected = get_location_from_ip()
+            detected = _cached_get_location_from_ip()
         if detected:
             st.session_state.ip_location = detected
             st.session_state.ip_location_used = False
@@ -740,14 +641,11 @@ with detect_col:
 
 # Show detected location and ask for confirmation
 if st.session_state.ip_location and not st.session_state.ip_location_used:
-    st.info(f"📍 **Detected location:** {st.session_state.ip_location}")
+    st.info(f"📍 **Detected location:** {', '.join(p for p in st.session_state.ip_location if p)}")
     confirm_col, reject_col, _ = st.columns([1, 1, 3])
     with confirm_col:
         if st.button("✅ Use this location"):
-            parts = [p.strip() for p in st.session_state.ip_location.split(",")]
-            city = parts[0] if len(parts) >= 1 else ""
-            state = parts[1] if len(parts) >= 2 else ""
-            country = parts[2] if len(parts) >= 3 else ""
+            city, state, country = st.session_state.ip_location
             # Set both canonical and widget keys so inputs update
             st.session_state.location_city = city
             st.session_state.location_state = state
@@ -763,59 +661,63 @@ if st.session_state.ip_location and not st.session_state.ip_location_used:
             st.session_state.ip_location_used = False
             st.rerun()
 
-city_col, state_col, country_col = st.columns(3)
-
-with city_col:
-    location_city = st.text_input(
-        "🏙️ City",
-        placeholder="e.g., Mumbai",
-        key="city_widget",
-    )
-with state_col:
-    location_state = st.text_input(
-        "🏛️ State / Region",
-        placeholder="e.g., Maharashtra",
-        key="state_widget",
-    )
-with country_col:
-    location_country = st.text_input(
-        "🌍 Country",
-        placeholder="e.g., India",
-        key="country_widget",
-    )
-
-st.markdown('</div>', unsafe_allow_html=True)
-
-# ── Date range ────────────────────────────────────────────────────────────
-
-#st.markdown('<div class="input-card">', unsafe_allow_html=True)
-st.markdown("### 📅 Dates")
-date_col1, date_col2 = st.columns(2)
-
-with date_col1:
-    start_date = st.date_input(
-        "🗓️ Start Date",
-        min_value=datetime.now().date(),
-        key="start_date_widget",
-    )
-with date_col2:
-    end_date = st.date_input(
-        "🏁 End Date",
-        min_value=datetime.now().date(),
-        key="end_date_widget",
+# ── Plan form — batches every input edit into one rerun on submit ─────────
+# Without the form, each text/date widget change triggered a full script
+# rerun; now only the submit button does.
+
+with st.form("plan_form", clear_on_submit=False):
+    st.markdown("### 📝 What are you planning?")
+    user_input = st.text_area(
+        "Describe your plan",
+        value=st.session_state.task_input,
+        placeholder="✨ e.g., Plan a beach day with friends, organize a hiking trip, arrange a garden party…",
+        height=90,
+        label_visibility="collapsed",
+        key="task_input_widget",
     )
 
-st.markdown('</div>', unsafe_allow_html=True)
+    city_col, state_col, country_col = st.columns(3)
+    with city_col:
+        location_city = st.text_input(
+            "🏙️ City",
+            placeholder="e.g., Mumbai",
+            key="city_widget",
+        )
+    with state_col:
+        location_state = st.text_input(
+            "🏛️ State / Region",
+            placeholder="e.g., Maharashtra",
+            key="state_widget",
+        )
+    with country_col:
+        location_country = st.text_input(
+            "🌍 Country",
+            placeholder="e.g., India",
+            key="country_widget",
+        )
 
-# ── Generate button ───────────────────────────────────────────────────────
+    st.markdown("### 📅 Dates")
+    date_col1, date_col2 = st.columns(2)
+    with date_col1:
+        start_date = st.date_input(
+            "🗓️ Start Date",
+            min_value=_TODAY,
+            key="start_date_widget",
+        )
+    with date_col2:
+        end_date = st.date_input(
+            "🏁 End Date",
+            min_value=_TODAY,
+            key="end_date_widget",
+        )
 
-_, btn_col, _ = st.columns([1, 2, 1])
-with btn_col:
-    generate_clicked = st.button(
-        "🚀 Generate Smart Plan",
-        type="primary",
-        use_container_width=True,
-    )
+    _, btn_col, _ = st.columns([1, 2, 1])
+    with btn_col:
+        generate_clicked = st.form_submit_button(
+            "🚀 Generate Smart Plan",
+            type="primary",
+            use_container_width=True,
+        )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -832,7 +734,8 @@ if generate_clicked:
     st.session_state.location_state = location_state
     st.session_state.location_country = location_country
 
-    if not user_input or not user_input.strip():
+    stripped_input = (user_input or "").strip()
+    if not stripped_input:
         st.warning("📝 Please describe what you're planning.")
         st.stop()
 
@@ -845,27 +748,39 @@ if generate_clicked:
         st.warning("📅 End date cannot be before start date.")
         st.stop()
 
-    with st.spinner("🤖 Analyzing your plan and checking weather conditions…"):
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
+    start_str = start_date.strftime("%Y-%m-%d")
+    end_str = end_date.strftime("%Y-%m-%d")
+
+    with st.status("🤖 Analyzing your plan…", expanded=False) as status:
+        _started = time.monotonic()
+
+        def _tick():
+            # Runs every poll slice while the agent works — keeps the UI
+            # alive instead of blocking silently on future.result()
+            elapsed = time.monotonic() - _started
+            status.update(
+                label=f"🤖 Analyzing your plan and checking weather… ({elapsed:.0f}s)"
+            )
 
         try:
-            response = _run_async(
-                run_chronos(
-                    user_request=user_input.strip(),
-                    location=location_str,
-                    start_date=start_str,
-                    end_date=end_str,
+            response = _escape_for_display(
+                _cached_generate(
+                    stripped_input, location_str, start_str, end_str, _progress_cb=_tick
                 )
             )
             st.session_state.response = response
+            status.update(label="✅ Plan ready", state="complete")
 
             # Auto-save on success
             if isinstance(response, ChronosResponse):
                 _save_plan(response)
 
+        except _AgentRunFailed as e:
+            st.session_state.response = e.error
+            status.update(label="❌ Plan generation failed", state="error")
         except Exception as e:
             st.error(f"An unexpected error occurred: {e}")
+            status.update(label="❌ Plan generation failed", state="error")
             st.session_state.response = AgentError(
                 error_type="UnexpectedError",
                 message=str(e),
@@ -878,15 +793,29 @@ if generate_clicked:
 # Results
 # ──────────────────────────────────────────────────────────────────────────────
 
-if st.session_state.response:
+# st.fragment (Streamlit >= 1.37) scopes reruns: typing in the task box no
+# longer re-renders the whole results/history tree. Older versions fall back
+# to a no-op decorator, i.e. the previous full-rerun behavior.
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda f: f)
+)
+
+
+@_fragment
+def _render_results() -> None:
+    """Results section — rerun-isolated from the input widgets above."""
     response = st.session_state.response
+    if not response:
+        return
     st.markdown('<div style="margin: 2rem 0; height: 2px; background: linear-gradient(90deg, #667eea, #764ba2); border-radius: 1px;"></div>', unsafe_allow_html=True)
 
     if isinstance(response, AgentError):
         st.markdown(
             f'<div style="background: #fee2e2; color: #dc2626; padding: 1.5rem; border-radius: 16px; border-left: 4px solid #ef4444; margin: 1rem 0;">'
-            f'<strong>❌ Error:</strong> {response.message}<br><br>'
-            f'<strong>💡 Suggestion:</strong> {response.suggestion}'
+            f'<strong>❌ Error:</strong> {html.escape(response.message)}<br><br>'
+            f'<strong>💡 Suggestion:</strong> {html.escape(response.suggestion)}'
             f'</div>',
             unsafe_allow_html=True
         )
@@ -901,51 +830,50 @@ if st.session_state.response:
         # ── Enhanced Summary Metrics ───────────────────────────────────────
         st.markdown("## 📊 Plan Summary")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown(
-                f'<div class="metric-card">'
-                f'<div style="font-size: 2rem; margin-bottom: 0.5rem;">📍</div>'
-                f'<div style="font-size: 0.8rem; color: #718096; margin-bottom: 0.25rem;">Location</div>'
-                f'<div style="font-weight: 600; color: #1a202c;">{response.extracted_location or "—"}</div>'
-                f'</div>',
-                unsafe_allow_html=True
-            )
-        with col2:
-            if is_multi_day:
-                date_label = (
-                    f"{format_date_human(response.start_date)} –<br>"
-                    f"{format_date_human(response.end_date)}"
-                )
-            elif response.start_date:
-                date_label = format_date_human(response.start_date)
-            else:
-                date_label = "—"
-            
-            st.markdown(
-                f'<div class="metric-card">'
-                f'<div style="font-size: 2rem; margin-bottom: 0.5rem;">📅</div>'
-                f'<div style="font-size: 0.8rem; color: #718096; margin-bottom: 0.25rem;">{"Duration" if is_multi_day else "Date"}</div>'
-                f'<div style="font-weight: 600; color: #1a202c;">{date_label}</div>'
-                f'</div>',
-                unsafe_allow_html=True
-            )
-        with col3:
-            if response.weather_relevance:
-                relevance_icon = "🌤️" if response.weather_relevance.is_relevant else "🏢"
-                relevance_text = "Weather Sensitive" if response.weather_relevance.is_relevant else "Indoor/Flexible"
-            else:
-                relevance_icon = "❓"
-                relevance_text = "Unknown"
-            
-            st.markdown(
-                f'<div class="metric-card">'
-                f'<div style="font-size: 2rem; margin-bottom: 0.5rem;">{relevance_icon}</div>'
-                f'<div style="font-size: 0.8rem; color: #718096; margin-bottom: 0.25rem;">Activity Type</div>'
-                f'<div style="font-weight: 600; color: #1a202c;">{relevance_text}</div>'
-                f'</div>',
-                unsafe_allow_html=True
+        if is_multi_day:
+            date_label = (
+                f"{format_date_human(response.start_date)} –<br>"
+                f"{format_date_human(response.end_date)}"
             )
+        elif response.start_date:
+            date_label = format_date_human(response.start_date)
+        else:
+            date_label = "—"
+
+        if response.weather_relevance:
+            relevance_icon = "🌤️" if response.weather_relevance.is_relevant else "🏢"
+            relevance_text = "Weather Sensitive" if response.weather_relevance.is_relevant else "Indoor/Flexible"
+        else:
+            relevance_icon = "❓"
+            relevance_text = "Unknown"
+
+        # One CSS-grid markdown instead of three st.columns cells — a single
+        # element for the browser to lay out, and the grid reflows on mobile
+        location_card = (
+            f'<div class="metric-card">'
+            f'<div style="font-size: 2rem; margin-bottom: 0.5rem;">📍</div>'
+            f'<div style="font-size: 0.8rem; color: #718096; margin-bottom: 0.25rem;">Location</div>'
+            f'<div style="font-weight: 600; color: #1a202c;">{response.extracted_location or "—"}</div>'
+            f'</div>'
+        )
+        date_card = (
+            f'<div class="metric-card">'
+            f'<div style="font-size: 2rem; margin-bottom: 0.5rem;">📅</div>'
+            f'<div style="font-size: 0.8rem; color: #718096; margin-bottom: 0.25rem;">{"Duration" if is_multi_day else "Date"}</div>'
+            f'<div style="font-weight: 600; color: #1a202c;">{date_label}</div>'
+            f'</div>'
+        )
+        relevance_card = (
+            f'<div class="metric-card">'
+            f'<div style="font-size: 2rem; margin-bottom: 0.5rem;">{relevance_icon}</div>'
+            f'<div style="font-size: 0.8rem; color: #718096; margin-bottom: 0.25rem;">Activity Type</div>'
+            f'<div style="font-weight: 600; color: #1a202c;">{relevance_text}</div>'
+            f'</div>'
+        )
+        st.markdown(
+            f'<div class="metrics-grid">{location_card}{date_card}{relevance_card}</div>',
+            unsafe_allow_html=True,
+        )
 
         # ── Feasibility gate ──────────────────────────────────────────────
         if not response.task_feasibility.feasible:
@@ -981,53 +909,80 @@ if st.session_state.response:
                 display_plan(response.plan_b, multi_day=is_multi_day)
                 st.markdown("</div>", unsafe_allow_html=True)
 
+            # ── Decision trace — rarely opened, so rendered lazily ────────
+            if response.decision_trace:
+                with st.expander("🧠 Agent Decision Trace", expanded=False):
+                    # Collapsed expander bodies still run each rerun; the
+                    # toggle keeps the trace HTML from being built until
+                    # someone actually asks for it (same pattern as history)
+                    if st.toggle("👁️ Show reasoning", key="show_decision_trace"):
+                        st.markdown(
+                            _trace_html(response.decision_trace),
+                            unsafe_allow_html=True,
+                        )
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Previous Plans
 # ──────────────────────────────────────────────────────────────────────────────
 
-if st.session_state.saved_plans:
+@_fragment
+def _render_history() -> None:
+    """Previous Plans section — rerun-isolated like the results fragment."""
+    if not st.session_state.saved_plans:
+        return
     st.markdown('<div style="margin: 3rem 0 2rem 0; height: 2px; background: linear-gradient(90deg, #667eea, #764ba2); border-radius: 1px;"></div>', unsafe_allow_html=True)
     st.markdown("## 📚 Previous Plans")
     st.markdown('<p style="color: #718096; margin-bottom: 1.5rem;">Review your previously generated plans</p>', unsafe_allow_html=True)
     
     for idx, snap in enumerate(st.session_state.saved_plans):
-        # Create a more attractive label with icons and better formatting
-        request_preview = snap['request'][:50] + "..." if len(snap['request']) > 50 else snap['request']
-        label = f"🗂️ {request_preview} • 📍 {snap['location']} • 📅 {snap['dates']}"
-        
+        label = snap.get("label") or f"🗂️ {snap['request'][:50]} • 📍 {snap['location']} • 📅 {snap['dates']}"
+
         with st.expander(label, expanded=False):
-            prev = snap["response"]
-            if isinstance(prev, ChronosResponse):
-                prev_multi = (
-                    prev.start_date
-                    and prev.end_date
-                    and prev.start_date != prev.end_date
-                )
-                
-                # Show timestamp
-                st.markdown(f'<small style="color: #718096;">Generated: {prev.generated_at}</small>', unsafe_allow_html=True)
-                st.markdown('<div style="margin: 1rem 0;"></div>', unsafe_allow_html=True)
-                
-                if prev.plan_a:
-                    st.markdown("### 📋 Original Plan")
-                    display_plan(prev.plan_a, multi_day=prev_multi)
-                if prev.plan_b:
-                    st.markdown("### ✨ Chronos Suggestions")
-                    display_plan(prev.plan_b, multi_day=prev_multi)
+            # Collapsed expanders still execute their body on every rerun,
+            # so gate the expensive plan rendering behind a per-plan
+            # toggle — the history section then costs O(1) per rerun
+            # until the user actually asks to see a plan.
+            show = st.toggle(
+                "👁️ Show full plan",
+                key=f"show_saved_{snap.get('id', idx)}",
+            )
+            if show:
+                payload = snap.get("response_json")
+                prev = _response_from_json(payload) if payload else snap.get("response")
+                if isinstance(prev, ChronosResponse):
+                    prev_multi = snap.get("multi_day", False)
+
+                    # Show timestamp
+                    st.markdown(f'<small style="color: #718096;">Generated: {prev.generated_at}</small>', unsafe_allow_html=True)
+                    st.markdown('<div style="margin: 1rem 0;"></div>', unsafe_allow_html=True)
+
+                    if prev.plan_a:
+                        st.markdown("### 📋 Original Plan")
+                        display_plan(prev.plan_a, multi_day=prev_multi)
+                    if prev.plan_b:
+                        st.markdown("### ✨ Chronos Suggestions")
+                        display_plan(prev.plan_b, multi_day=prev_multi)
+
+
+_render_results()
+_render_history()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Footer
 # ──────────────────────────────────────────────────────────────────────────────
 
-# Close main app container
-st.markdown('</div>', unsafe_allow_html=True)
-
-st.markdown(
+# Static markup; the container close and footer fuse into one emit.
+# (Like the CSS/header, this must re-emit every rerun — Streamlit drops
+# elements a pass doesn't produce, so first-mount-only gating would make
+# the footer vanish on the next interaction.)
+_FOOTER_HTML = (
+    '</div>'  # closes the main app container
     '<div class="footer">'
     '🌤️ <strong>Chronos</strong> — Your intelligent weather-adaptive planning companion<br>'
     '<small style="opacity: 0.7;">Powered by AI • Built with ❤️ by Team HackIconics</small>'
-    '</div>',
-    unsafe_allow_html=True,
+    '</div>'
 )
+
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
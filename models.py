@@ -5,12 +5,23 @@ These Pydantic models define EXACTLY what the agent can output.
 No free-form text - everything is typed and validated.
 """
 
-from datetime import datetime
+import time
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
 
 
+def _iso_now() -> str:
+    """Local time as YYYY-MM-DDTHH:MM:SS without building a datetime —
+    time.localtime + f-string is markedly cheaper than
+    datetime.now().isoformat() and this runs per response construction."""
+    tm = time.localtime()
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+
+
 class RiskLevel(str, Enum):
     """Risk assessment levels for weather impact."""
     LOW = "low"
@@ -102,7 +113,7 @@ class ChronosResponse(BaseModel):
     decision_trace: list[DecisionPoint] = Field(default_factory=list, description="Key decisions and their reasoning")
     
     # Meta
-    generated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    generated_at: str = Field(default_factory=_iso_now)
     agent_confidence: float = Field(ge=0, le=1, description="Overall confidence in recommendations")
 
 
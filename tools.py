@@ -7,9 +7,16 @@ Handles weather data fetching with:
 - Graceful fallbacks on API failures
 """
 
+import asyncio
+import heapq
+import json
 import os
 import random
-from datetime import datetime, timedelta
+import time
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 import httpx
@@ -17,175 +24,307 @@ import httpx
 from models import WeatherCondition
 
 
-# Simple in-memory cache: {(location, date): (WeatherCondition, timestamp)}
-_weather_cache: dict[tuple[str, str], tuple[WeatherCondition, datetime]] = {}
+# Simple in-memory cache:
+# {(location, date, simulated): (WeatherCondition, expires_at_monotonic, cached_at)}
+# The hot lookup path compares monotonic floats (far cheaper than
+# datetime.now() + timedelta arithmetic per hit); the wall-clock cached_at
+# rides along only for the disk snapshot.
+_weather_cache: dict[tuple[str, str, bool], tuple[WeatherCondition, float, datetime]] = {}
 CACHE_TTL_MINUTES = 30
+_CACHE_TTL_SECONDS = CACHE_TTL_MINUTES * 60
 
+# Min-heap of (expires_at, key) so inserts can proactively drop expired
+# entries instead of leaving them until the next unlucky lookup
+_expiry_heap: list[tuple[float, tuple[str, str, bool]]] = []
 
-def _is_cache_valid(cache_time: datetime) -> bool:
-    """Check if cached data is still fresh."""
-    return datetime.now() - cache_time < timedelta(minutes=CACHE_TTL_MINUTES)
 
+def _cache_key(location: str, date: str, use_simulation: bool) -> tuple[str, str, bool]:
+    """Normalized cache key — whitespace/case variants of a location hit
+    the same entry, and simulated results never alias live ones."""
+    return (location.strip().lower(), date, use_simulation)
 
-def _get_cached_weather(location: str, date: str) -> Optional[WeatherCondition]:
+
+def _evict_expired(now_mono: float) -> None:
+    """Pop expired entries off the heap (and cache) — O(expired) per call."""
+    while _expiry_heap and _expiry_heap[0][0] <= now_mono:
+        _, key = heapq.heappop(_expiry_heap)
+        entry = _weather_cache.get(key)
+        if entry is not None and entry[1] <= now_mono:
+            del _weather_cache[key]
+
+
+def _get_cached_weather(location: str, date: str, use_simulation: bool = False) -> Optional[WeatherCondition]:
     """Retrieve weather from cache if valid."""
-    key = (location.lower(), date)
-    if key in _weather_cache:
-        weather, cache_time = _weather_cache[key]
-        if _is_cache_valid(cache_time):
+    key = _cache_key(location, date, use_simulation)
+    entry = _weather_cache.get(key)
+    if entry is not None:
+        weather, expires_at, _ = entry
+        if expires_at > time.monotonic():
             return weather
         # Expired - remove from cache
         del _weather_cache[key]
     return None
 
 
-def _store_cached_weather(location: str, date: str, weather: WeatherCondition) -> None:
+def _store_cached_weather(location: str, date: str, weather: WeatherCondition, use_simulation: bool = False) -> None:
     """Store weather data in cache."""
-    key = (location.lower(), date)
-    _weather_cache[key] = (weather, datetime.now())
+    now_mono = time.monotonic()
+    _evict_expired(now_mono)
+    key = _cache_key(location, date, use_simulation)
+    expires_at = now_mono + _CACHE_TTL_SECONDS
+    _weather_cache[key] = (weather, expires_at, datetime.now())
+    heapq.heappush(_expiry_heap, (expires_at, key))
+    if not use_simulation:
+        _schedule_disk_save()
 
 
-def generate_simulated_weather(location: str, date: str) -> WeatherCondition:
-    """
-    Generate realistic simulated weather for demos.
-    Provides consistent results for same location/date within a session.
-    """
-    # Use location + date as seed for reproducible "random" weather
-    seed_value = hash(f"{location.lower()}_{date}") % 10000
-    random.seed(seed_value)
-    
+# ── Disk persistence — live forecasts survive app restarts ───────────────────
+# Simulated entries are never persisted (they are free to regenerate and
+# meaningless across sessions).
+_CACHE_FILE = Path(__file__).parent / ".weather_cache.json"
+
+
+# Snapshot writes are debounced and pushed to a worker thread: a
+# multi-day gather stores N results in a burst, and rewriting the whole
+# file N times synchronously would stall the event loop mid-fetch
+_disk_flush_scheduled = False
+
+
+async def _flush_disk_cache() -> None:
+    """Debounce briefly to coalesce a burst of stores, then write off-loop."""
+    global _disk_flush_scheduled
+    await asyncio.sleep(0.1)
+    # Clear before writing so stores landing during the write re-arm
+    _disk_flush_scheduled = False
+    await asyncio.to_thread(_save_disk_cache)
+
+
+def _schedule_disk_save() -> None:
+    """Queue one deferred snapshot; falls back to a direct write when no
+    event loop is running (e.g. synchronous callers in tests)."""
+    global _disk_flush_scheduled
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _save_disk_cache()
+        return
+    if not _disk_flush_scheduled:
+        _disk_flush_scheduled = True
+        loop.create_task(_flush_disk_cache())
+
+
+def _save_disk_cache() -> None:
+    """Best-effort snapshot of live cache entries; never raises."""
+    try:
+        payload = {
+            f"{loc}|{date}": {
+                "cached_at": cache_time.isoformat(),
+                "weather": weather.model_dump(),
+            }
+            for (loc, date, simulated), (weather, _, cache_time) in _weather_cache.items()
+            if not simulated
+        }
+        _CACHE_FILE.write_text(json.dumps(payload))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _load_disk_cache() -> None:
+    """Warm the in-memory cache from the previous session's snapshot."""
+    try:
+        raw = json.loads(_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return
+    if not isinstance(raw, dict):
+        return
+    now_mono = time.monotonic()
+    for key_str, entry in raw.items():
+        try:
+            location, date = key_str.rsplit("|", 1)
+            cache_time = datetime.fromisoformat(entry["cached_at"])
+            age = (datetime.now() - cache_time).total_seconds()
+            if age >= _CACHE_TTL_SECONDS:
+                continue
+            weather = WeatherCondition.model_validate(entry["weather"])
+            key = (location, date, False)
+            expires_at = now_mono + _CACHE_TTL_SECONDS - age
+            _weather_cache[key] = (weather, expires_at, cache_time)
+            heapq.heappush(_expiry_heap, (expires_at, key))
+        except Exception:
+            continue  # Skip corrupt entries, keep the rest
+
+
+_load_disk_cache()
+
+
+@lru_cache(maxsize=512)
+def _simulated_weather_cached(location: str, date: str) -> WeatherCondition:
+    """Memoized simulation core — deterministic per (location, date), so
+    repeat calls skip the random generation entirely."""
+    # Use location + date as seed for reproducible "random" weather.
+    # adler32 is stable across processes — built-in hash() is randomized
+    # by PYTHONHASHSEED, which silently broke the reproducibility this
+    # docstring promises between app restarts. A local Random instance
+    # avoids reseeding (and perturbing) the global generator.
+    seed_value = zlib.adler32(location.lower().encode()) ^ zlib.adler32(date.encode())
+    rng = random.Random(seed_value)
+
     conditions = ["sunny", "partly cloudy", "cloudy", "light rain", "rainy", "thunderstorms"]
     weights = [0.25, 0.25, 0.2, 0.15, 0.1, 0.05]  # Bias toward good weather for demos
-    
-    condition = random.choices(conditions, weights=weights)[0]
-    
+
+    condition = rng.choices(conditions, weights=weights)[0]
+
     # Temperature based on condition
-    base_temp = random.uniform(15, 28)
+    base_temp = rng.uniform(15, 28)
     if "rain" in condition or condition == "thunderstorms":
-        base_temp -= random.uniform(3, 8)
-    
+        base_temp -= rng.uniform(3, 8)
+
     # Precipitation chance based on condition
     precip_map = {
-        "sunny": random.randint(0, 10),
-        "partly cloudy": random.randint(5, 25),
-        "cloudy": random.randint(15, 40),
-        "light rain": random.randint(50, 70),
-        "rainy": random.randint(70, 90),
-        "thunderstorms": random.randint(80, 100)
+        "sunny": rng.randint(0, 10),
+        "partly cloudy": rng.randint(5, 25),
+        "cloudy": rng.randint(15, 40),
+        "light rain": rng.randint(50, 70),
+        "rainy": rng.randint(70, 90),
+        "thunderstorms": rng.randint(80, 100)
     }
-    
-    return WeatherCondition(
+
+    # model_construct skips validation — safe here because every field is
+    # generated in-range by construction (weights, randint bounds, round)
+    return WeatherCondition.model_construct(
         temperature_celsius=round(base_temp, 1),
         condition=condition,
         precipitation_chance=precip_map[condition],
-        wind_speed_kmh=round(random.uniform(5, 25), 1),
-        humidity_percent=random.randint(40, 85),
+        wind_speed_kmh=round(rng.uniform(5, 25), 1),
+        humidity_percent=rng.randint(40, 85),
         forecast_date=date,
         location=location,
         is_simulated=True
     )
 
 
+def generate_simulated_weather(location: str, date: str) -> WeatherCondition:
+    """
+    Generate realistic simulated weather for demos.
+    Provides consistent results for the same location/date, including
+    across app restarts.
+    """
+    # Copy the memoized instance — callers mutate is_simulated on API
+    # fallback, and a shared object would poison the cache
+    return _simulated_weather_cached(location, date).model_copy()
+
+
+# Shared HTTP client — reusing one pooled client avoids a fresh TCP+TLS
+# handshake per weather call, and concurrent per-day fetches share
+# keep-alive connections. Created lazily so importing tools.py stays cheap.
+# (HTTP/2 would need the optional 'h2' extra, so we stay on HTTP/1.1.)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            headers={"User-Agent": "Chronos-Agent/1.0"},
+        )
+    return _http_client
+
+
 async def fetch_weather_from_api(location: str, date: str) -> Optional[WeatherCondition]:
     """
     Fetch weather from wttr.in API (free, no key required).
-    
+
     wttr.in provides a 3-day forecast. If the requested date falls outside
     that window the function returns None so the caller can fall back.
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # wttr.in JSON endpoint
-            url = f"https://wttr.in/{location}?format=j1"
-            resp = await client.get(url, headers={"User-Agent": "Chronos-Agent/1.0"})
-            resp.raise_for_status()
-            data = resp.json()
-            
-            weather_list = data.get("weather", [])
-            
-            # ── Find the exact forecast for the requested date ────────────
-            forecast = None
-            for w in weather_list:
-                if w.get("date") == date:
-                    forecast = w
-                    break
-            
-            # If the exact date isn't in the forecast window → give up
-            # (don't silently use a different day's data)
-            if not forecast:
-                print(f"[Weather API] Date {date} not in wttr.in forecast window — skipping")
-                return None
-            
-            # ── Temperature (average of max and min for that day) ─────────
-            temp_max = float(forecast.get("maxtempC", 20))
-            temp_min = float(forecast.get("mintempC", 15))
-            avg_temp = (temp_max + temp_min) / 2
-            
-            # ── Hourly slice — use midday (index 4 ≈ 12:00) ──────────────
-            hourly = forecast.get("hourly", [])
-            midday = hourly[4] if len(hourly) > 4 else hourly[0] if hourly else {}
-            
-            # ── Condition from the FORECAST day, not current_condition ────
-            # Try midday hourly description first (most representative)
-            condition = (
-                midday.get("weatherDesc", [{}])[0].get("value", "")
-                if midday
-                else ""
-            )
-            # Fallback: use the overall daily "astronomy"/"hourly" if empty
-            if not condition and hourly:
-                condition = hourly[0].get("weatherDesc", [{}])[0].get("value", "partly cloudy")
-            condition = condition.lower() if condition else "partly cloudy"
-            
-            # ── Precipitation, wind, humidity from the forecast day ───────
-            precip_chance = int(midday.get("chanceofrain", 0))
-            wind_speed = float(midday.get("windspeedKmph", 10))
-            humidity = int(midday.get("humidity", 65))
-            
-            # ── Resolved location name ────────────────────────────────────
-            nearest_area = data.get("nearest_area", [{}])[0]
-            resolved_name = nearest_area.get("areaName", [{}])[0].get("value", location)
-            
-            return WeatherCondition(
-                temperature_celsius=round(avg_temp, 1),
-                condition=condition,
-                precipitation_chance=precip_chance,
-                wind_speed_kmh=round(wind_speed, 1),
-                humidity_percent=humidity,
-                forecast_date=date,
-                location=resolved_name,
-                is_simulated=False
-            )
-            
+        client = _get_http_client()
+        # wttr.in JSON endpoint
+        url = f"https://wttr.in/{location}?format=j1"
+        resp = await client.get(url)
+        resp.raise_for_status()
+        data = resp.json()
+
+        weather_list = data.get("weather", [])
+
+        # ── Find the exact forecast for the requested date ────────────
+        forecast = None
+        for w in weather_list:
+            if w.get("date") == date:
+                forecast = w
+                break
+
+        # If the exact date isn't in the forecast window → give up
+        # (don't silently use a different day's data)
+        if not forecast:
+            print(f"[Weather API] Date {date} not in wttr.in forecast window — skipping")
+            return None
+
+        # ── Temperature (average of max and min for that day) ─────────
+        temp_max = float(forecast.get("maxtempC", 20))
+        temp_min = float(forecast.get("mintempC", 15))
+        avg_temp = (temp_max + temp_min) / 2
+
+        # ── Hourly slice — use midday (index 4 ≈ 12:00) ──────────────
+        hourly = forecast.get("hourly", [])
+        midday = hourly[4] if len(hourly) > 4 else hourly[0] if hourly else {}
+
+        # ── Condition from the FORECAST day, not current_condition ────
+        # Try midday hourly description first (most representative)
+        condition = (
+            midday.get("weatherDesc", [{}])[0].get("value", "")
+            if midday
+            else ""
+        )
+        # Fallback: use the overall daily "astronomy"/"hourly" if empty
+        if not condition and hourly:
+            condition = hourly[0].get("weatherDesc", [{}])[0].get("value", "partly cloudy")
+        condition = condition.lower() if condition else "partly cloudy"
+
+        # ── Precipitation, wind, humidity from the forecast day ───────
+        precip_chance = int(midday.get("chanceofrain", 0))
+        wind_speed = float(midday.get("windspeedKmph", 10))
+        humidity = int(midday.get("humidity", 65))
+
+        # ── Resolved location name ────────────────────────────────────
+        nearest_area = data.get("nearest_area", [{}])[0]
+        resolved_name = nearest_area.get("areaName", [{}])[0].get("value", location)
+
+        # Types are already coerced above (float/int casts raise into the
+        # except below on garbage), so skip a second pydantic validation pass
+        return WeatherCondition.model_construct(
+            temperature_celsius=round(avg_temp, 1),
+            condition=condition,
+            precipitation_chance=precip_chance,
+            wind_speed_kmh=round(wind_speed, 1),
+            humidity_percent=humidity,
+            forecast_date=date,
+            location=resolved_name,
+            is_simulated=False
+        )
+
     except Exception as e:
         # Log error but don't crash - return None to trigger fallback
         print(f"[Weather API Error] {type(e).__name__}: {e}")
         return None
 
 
-async def get_weather(
+# In-flight request coalescing: concurrent lookups for the same key share
+# one fetch instead of racing N identical API calls past the cold cache
+_inflight: dict[tuple[str, str, bool], "asyncio.Task[WeatherCondition]"] = {}
+
+
+async def _fetch_and_cache(
     location: str,
     date: str,
-    use_simulation: bool = False
+    use_simulation: bool
 ) -> WeatherCondition:
-    """
-    Main weather access function with caching and fallback.
-    
-    Priority:
-    1. Return cached data if available and fresh
-    2. If simulation mode, generate simulated weather
-    3. Try real API
-    4. Fall back to simulation on API failure
-    
-    This function NEVER raises exceptions - always returns data.
-    """
-    # Check cache first
-    cached = _get_cached_weather(location, date)
-    if cached:
-        return cached
-    
+    """Resolve weather (simulation or API with fallback) and cache it."""
     weather: WeatherCondition
-    
+
     if use_simulation:
         # Simulation mode for demos
         weather = generate_simulated_weather(location, date)
@@ -199,16 +338,55 @@ async def get_weather(
             weather = generate_simulated_weather(location, date)
             # Mark it as simulated since API failed
             weather.is_simulated = True
-    
+
     # Cache the result
-    _store_cached_weather(location, date, weather)
-    
+    _store_cached_weather(location, date, weather, use_simulation)
+
     return weather
 
 
+async def get_weather(
+    location: str,
+    date: str,
+    use_simulation: bool = False
+) -> WeatherCondition:
+    """
+    Main weather access function with caching and fallback.
+
+    Priority:
+    1. Return cached data if available and fresh
+    2. Share any identical fetch already in flight
+    3. If simulation mode, generate simulated weather
+    4. Try real API
+    5. Fall back to simulation on API failure
+
+    This function NEVER raises exceptions - always returns data.
+    """
+    # Check cache first
+    cached = _get_cached_weather(location, date, use_simulation)
+    if cached:
+        return cached
+
+    key = _cache_key(location, date, use_simulation)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_cache(location, date, use_simulation))
+        _inflight[key] = task
+        try:
+            return await task
+        finally:
+            _inflight.pop(key, None)
+    return await task
+
+
 def clear_weather_cache() -> None:
-    """Clear the weather cache (useful for testing)."""
+    """Clear the weather cache, including the on-disk snapshot (useful for testing)."""
     _weather_cache.clear()
+    _expiry_heap.clear()
+    try:
+        _CACHE_FILE.unlink(missing_ok=True)
+    except OSError:
+        pass
 
 
 # ──────────────────────────────────────────────────────────────────────────────
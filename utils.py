@@ -9,8 +9,13 @@ Keeps agent.py clean by handling:
 """
 
 import re
+import sys
+import time
+from bisect import bisect_right
+
 import requests
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 
@@ -21,70 +26,120 @@ from models import RiskLevel, WeatherCondition
 # Date Parsing
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Reused timedelta constant — avoids rebuilding the same object per call
+_ONE_DAY = timedelta(days=1)
+
+# Explicit YYYY-MM-DD dates, compiled once
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Weekday name → weekday() index, hoisted so it isn't rebuilt per call
+_DAY_NAMES = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+# Every relative-date token in one alternation — a single C-level scan
+# collects all hits, and the priority dispatch happens afterwards on the
+# token set. "next week(?!e)" refuses to swallow the front of
+# "next weekend" so the weekend token still fires there. The plan group
+# deliberately has no boundaries: "planning" should hit "plan", matching
+# the old substring checks.
+_DATE_TOKEN_RE = re.compile(
+    r'(?P<today>today)|(?P<tomorrow>tomorrow)|(?P<weekend>weekend)'
+    r'|(?P<next_week>next week(?!e))'
+    r'|(?P<weekday>monday|tuesday|wednesday|thursday|friday|saturday|sunday)'
+    r'|(?P<plan>plan|schedule|organize|arrange)'
+)
+
+# Offset tables indexed by today.weekday() — precomputed so the weekend /
+# next-week branches are a single list index instead of modulo + branch.
+# Saturday keeps 0 when today IS Saturday (the weekend is already here);
+# "next week" always lands on a future Monday.
+_SATURDAY_OFFSET = [5, 4, 3, 2, 1, 0, 6]
+_MONDAY_OFFSET = [7, 6, 5, 4, 3, 2, 1]
+
+
+def _ymd(d: datetime) -> str:
+    """Format as YYYY-MM-DD — f-string is ~5x cheaper than strftime."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
 def parse_relative_date(text: str) -> Optional[str]:
     """
     Parse relative date expressions to YYYY-MM-DD format.
-    
+
     Handles: today, tomorrow, this weekend, next week, etc.
     Returns None if no date expression found.
     """
-    text_lower = text.lower()
-    today = datetime.now()
-    
+    # Keyed on (text, today) so the memo stays correct across midnight
+    return _parse_relative_date_impl(text, datetime.now().toordinal())
+
+
+@lru_cache(maxsize=256)
+def _parse_relative_date_impl(text: str, today_ordinal: int) -> Optional[str]:
+    """Memoized parsing core — same text on the same day is a dict hit."""
+    today = datetime.fromordinal(today_ordinal)
+
+    # One scan collects every token; several can hit in the same text
+    # ("plan a picnic tomorrow"), so dispatch runs in the original
+    # priority order below, not text order
+    found = set()
+    found_weekdays = set()
+    for token_match in _DATE_TOKEN_RE.finditer(text.lower()):
+        if token_match.lastgroup == "weekday":
+            found_weekdays.add(token_match.group())
+        else:
+            found.add(token_match.lastgroup)
+
     # Direct matches
-    if "today" in text_lower:
-        return today.strftime("%Y-%m-%d")
-    
-    if "tomorrow" in text_lower:
-        return (today + timedelta(days=1)).strftime("%Y-%m-%d")
-    
-    if "this weekend" in text_lower or "weekend" in text_lower:
+    if "today" in found:
+        return _ymd(today)
+
+    if "tomorrow" in found:
+        return _ymd(today + _ONE_DAY)
+
+    if "weekend" in found:
         # Find next Saturday
-        days_until_saturday = (5 - today.weekday()) % 7
-        if days_until_saturday == 0 and today.weekday() != 5:
-            days_until_saturday = 7
-        saturday = today + timedelta(days=days_until_saturday)
-        return saturday.strftime("%Y-%m-%d")
-    
-    if "next week" in text_lower:
+        return _ymd(today + timedelta(days=_SATURDAY_OFFSET[today.weekday()]))
+
+    if "next_week" in found:
         # Next Monday
-        days_until_monday = (7 - today.weekday()) % 7
-        if days_until_monday == 0:
-            days_until_monday = 7
-        next_monday = today + timedelta(days=days_until_monday)
-        return next_monday.strftime("%Y-%m-%d")
-    
-    # Day names (e.g., "on Friday", "this Friday")
-    day_names = {
-        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-        "friday": 4, "saturday": 5, "sunday": 6
-    }
-    for day_name, day_num in day_names.items():
-        if day_name in text_lower:
-            days_ahead = (day_num - today.weekday()) % 7
-            if days_ahead == 0:
-                days_ahead = 7  # Assume next week if today
-            target = today + timedelta(days=days_ahead)
-            return target.strftime("%Y-%m-%d")
-    
+        return _ymd(today + timedelta(days=_MONDAY_OFFSET[today.weekday()]))
+
+    # Day names (e.g., "on Friday", "this Friday") — the shifted modulo
+    # maps a same-day mention to next week (1..7, never 0)
+    if found_weekdays:
+        for day_name, day_num in _DAY_NAMES.items():
+            if day_name in found_weekdays:
+                days_ahead = (day_num - today.weekday() - 1) % 7 + 1
+                return _ymd(today + timedelta(days=days_ahead))
+
     # Try to find explicit date (YYYY-MM-DD or MM/DD)
-    date_pattern = r'(\d{4}-\d{2}-\d{2})'
-    match = re.search(date_pattern, text)
+    match = _DATE_RE.search(text)
     if match:
         return match.group(1)
-    
+
     # Default to tomorrow if no date found but planning implies future
-    planning_keywords = ["plan", "schedule", "organize", "arrange"]
-    if any(kw in text_lower for kw in planning_keywords):
-        return (today + timedelta(days=1)).strftime("%Y-%m-%d")
-    
+    if "plan" in found:
+        return _ymd(today + _ONE_DAY)
+
     return None
 
 
+@lru_cache(maxsize=512)
 def format_date_human(date_str: str) -> str:
-    """Convert YYYY-MM-DD to human-readable format."""
+    """Convert YYYY-MM-DD to human-readable format.
+
+    Memoized — render paths call this repeatedly with the same handful of
+    dates, and parsing/strftime are the expensive part.
+    """
     try:
-        date = datetime.strptime(date_str, "%Y-%m-%d")
+        if len(date_str) == 10:
+            # Fixed-width fast path: slicing + datetime() skips strptime's
+            # format-string machinery entirely
+            date = datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+        else:
+            date = datetime.strptime(date_str, "%Y-%m-%d")
         return date.strftime("%A, %B %d, %Y")
     except ValueError:
         return date_str
@@ -94,24 +149,46 @@ def format_date_human(date_str: str) -> str:
 # Location Input & Detection
 # ──────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+# Confidence by presence bits (city, state, country) — one index replaces
+# the old branch ladder; values mirror its exact outputs
+_CONFIDENCE_TABLE = (
+    0.0,   # ---
+    0.5,   # country only
+    0.0,   # state only
+    0.7,   # state + country
+    0.95,  # city only
+    1.0,   # city + country
+    1.0,   # city + state
+    1.0,   # city + state + country
+)
+
+
+@dataclass(slots=True)
 class LocationInput:
-    """Structured location input with multiple levels of specificity."""
+    """Structured location input with multiple levels of specificity.
+
+    Slotted — instances are built per UI event, and slots drop the
+    per-instance __dict__ while speeding up field access.
+    """
     city: Optional[str] = None
     state: Optional[str] = None
     country: Optional[str] = None
     auto_detect: bool = False
-    
+
+    def __post_init__(self) -> None:
+        """Normalize once at ingest — downstream code never re-strips.
+
+        Title-casing is deliberately NOT applied here: it would mangle
+        inputs like "USA" or "UK".
+        """
+        self.city = (self.city.strip() or None) if self.city else None
+        self.state = (self.state.strip() or None) if self.state else None
+        self.country = (self.country.strip() or None) if self.country else None
+
     def __str__(self) -> str:
         """Generate location string from available components."""
-        parts = []
-        if self.city:
-            parts.append(self.city)
-        if self.state:
-            parts.append(self.state)
-        if self.country:
-            parts.append(self.country)
-        return ", ".join(parts) if parts else None
+        joined = ", ".join(p for p in (self.city, self.state, self.country) if p)
+        return joined if joined else None
     
     def is_empty(self) -> bool:
         """Check if no explicit location is provided."""
@@ -120,24 +197,25 @@ class LocationInput:
     def confidence(self) -> float:
         """
         Calculate input confidence (0.0 to 1.0).
-        City only: 1.0 (strongest signal)
-        City + State/Country: 0.9
+        City only: 0.95 (strongest single signal)
+        City + State/Country: 1.0
         State + Country: 0.7 (weaker signal)
         Country only: 0.5
         """
-        if self.city:
-            return 1.0 if (self.state or self.country) else 0.95
-        elif self.state and self.country:
-            return 0.7
-        elif self.country:
-            return 0.5
-        return 0.0
+        return _CONFIDENCE_TABLE[
+            (bool(self.city) << 2) | (bool(self.state) << 1) | bool(self.country)
+        ]
+
+
+# Shared session so the provider cascade reuses pooled connections
+# instead of paying a fresh TCP+TLS handshake per requests.get call
+_HTTP_SESSION = requests.Session()
 
 
 def _detect_via_ip_api() -> Optional[str]:
     """Detect location using ip-api.com (free, no key required)."""
     try:
-        resp = requests.get("http://ip-api.com/json/?fields=city,regionName,country", timeout=5)
+        resp = _HTTP_SESSION.get("http://ip-api.com/json/?fields=city,regionName,country", timeout=5)
         if resp.status_code == 200:
             data = resp.json()
             parts = [v for v in (data.get("city"), data.get("regionName"), data.get("country")) if v]
@@ -151,7 +229,7 @@ def _detect_via_ip_api() -> Optional[str]:
 def _detect_via_ipapi_co() -> Optional[str]:
     """Detect location using ipapi.co (free tier, no key required)."""
     try:
-        resp = requests.get("https://ipapi.co/json/", timeout=5)
+        resp = _HTTP_SESSION.get("https://ipapi.co/json/", timeout=5)
         if resp.status_code == 200:
             data = resp.json()
             parts = [v for v in (data.get("city"), data.get("region"), data.get("country_name")) if v]
@@ -165,7 +243,7 @@ def _detect_via_ipapi_co() -> Optional[str]:
 def _detect_via_wttr() -> Optional[str]:
     """Detect location using wttr.in weather service."""
     try:
-        response = requests.get("https://wttr.in/?format=j1", timeout=5)
+        response = _HTTP_SESSION.get("https://wttr.in/?format=j1", timeout=5)
         if response.status_code == 200:
             data = response.json()
             nearest = data.get("nearest_area", [{}])[0]
@@ -180,6 +258,13 @@ def _detect_via_wttr() -> Optional[str]:
     return None
 
 
+# Successful detections cached for an hour — the machine's IP rarely
+# changes mid-session and every miss costs up to three blocking HTTP
+# calls. Failures are not cached so a flaky network can recover.
+_IP_CACHE_TTL_SECONDS = 3600
+_ip_cache: tuple[float, Optional[str]] = (0.0, None)
+
+
 def get_location_from_ip() -> Optional[str]:
     """
     Auto-detect location via IP using a cascade of free services.
@@ -190,10 +275,17 @@ def get_location_from_ip() -> Optional[str]:
       3. wttr.in       — last resort (heavier response)
 
     Returns: "City, Region, Country" or None if every service fails.
+    Results are cached in-process for an hour.
     """
+    global _ip_cache
+    cached_at, cached = _ip_cache
+    if cached is not None and time.time() - cached_at < _IP_CACHE_TTL_SECONDS:
+        return cached
+
     for provider in (_detect_via_ip_api, _detect_via_ipapi_co, _detect_via_wttr):
         result = provider()
         if result:
+            _ip_cache = (time.time(), result)
             return result
     return None
 
@@ -224,23 +316,29 @@ def normalize_location(
     Returns: formatted location string suitable for weather_tool()
     """
     
+    # Strip once up front; every branch below assumes clean fields
+    # (blank-after-strip inputs also correctly fall through as empty)
+    city = city.strip() if city else None
+    state = state.strip() if state else None
+    country = country.strip() if country else None
+
     # Priority 1: Explicit inputs with strongest signal first
     if city:
         # City is the strongest signal
-        parts = [city.strip()]
+        parts = [city]
         if state:
-            parts.append(state.strip())
+            parts.append(state)
         if country:
-            parts.append(country.strip())
+            parts.append(country)
         return ", ".join(parts)
-    
+
     # Second strongest: state + country combination
     if state and country:
-        return f"{state.strip()}, {country.strip()}"
-    
+        return f"{state}, {country}"
+
     # Single country
     if country:
-        return country.strip()
+        return country
     
     # Priority 2: Parse text input for partial location patterns
     if text_input:
@@ -267,55 +365,82 @@ def extract_location_from_text(text: str) -> Optional[str]:
     - "Gujarat, India" (state, country)
     - "New York, USA" (city, country)
     """
-    text_lower = text.lower().strip()
-    
-    # Check for known cities first (strongest partial signal)
-    for city in COMMON_CITIES:
-        if city in text_lower:
+    # One combined regex pass picks up both known cities and preposition
+    # clauses; priority between them is resolved afterwards so known
+    # cities still win (they are the strongest partial signal)
+    prep_fallback = None
+    for match in _LOC_RE.finditer(text):
+        city = match.group("city")
+        if city:
             return city.title()
-    
+        location = match.group("prep_loc")
+        loc_lower = location.lower()
+        # The scan is non-overlapping, so "in Miami" consumes the city
+        # token inside the preposition branch — a capture that IS a known
+        # city (or starts with one) must still count as a city hit
+        if loc_lower in COMMON_CITIES:
+            return location.title()
+        head = loc_lower.split(" ", 1)[0]
+        if head in COMMON_CITIES:
+            return head.title()
+        if prep_fallback is None and loc_lower not in _NON_LOCATIONS:
+            # Filter out common non-location words
+            prep_fallback = location
+
     # Look for "City, State" or "City, Country" patterns
     if "," in text:
         parts = [p.strip() for p in text.split(",")]
         if len(parts) >= 2:
             # Assume format: [City/State], [State/Country/Country]
             return ", ".join(parts).title()
-    
-    # Look for "in/at/near [Location]" patterns
-    location_prepositions = ["in", "at", "near", "around", "to"]
-    for prep in location_prepositions:
-        pattern = rf'\b{prep}\s+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?)'
-        match = re.search(pattern, text)
-        if match:
-            location = match.group(1)
-            # Filter out common non-location words
-            non_locations = {"the", "a", "an", "my", "our", "this", "that"}
-            if location.lower() not in non_locations:
-                return location
-    
-    return None
+
+    # Fall back to the "in/at/near [Location]" capture, if any
+    return prep_fallback
 
 
 # Common location indicators
 LOCATION_PREPOSITIONS = ["in", "at", "near", "around", "to"]
 
+def _frozen(words: set[str]) -> frozenset[str]:
+    """Freeze a keyword set with interned members — interned strings let
+    membership tests hit CPython's identity fast path before hashing."""
+    return frozenset(sys.intern(w) for w in words)
+
+
+# Capitalized words after a preposition that are not places
+_NON_LOCATIONS = _frozen({"the", "a", "an", "my", "our", "this", "that"})
+
 # Known city names (subset for quick matching)
-COMMON_CITIES = {
+COMMON_CITIES = _frozen({
     "new york", "los angeles", "chicago", "houston", "phoenix", "philadelphia",
     "san antonio", "san diego", "dallas", "san jose", "austin", "seattle",
     "denver", "boston", "miami", "atlanta", "london", "paris", "tokyo",
     "sydney", "toronto", "vancouver", "berlin", "madrid", "rome", "amsterdam",
     "vadodara", "mumbai", "delhi", "bangalore", "hyderabad", "pune", "kolkata"
-}
+})
+
+# Single combined pattern: known cities (case-insensitive via inline flag,
+# longest-first so "new york" wins over any shorter overlap) plus the
+# "in/at/near Capitalized" clause, which stays case-sensitive because the
+# capital letter is the signal. One C-level scan replaces the old
+# per-city substring checks and per-preposition regex searches.
+_LOC_RE = re.compile(
+    r'(?P<city>(?i:'
+    + "|".join(re.escape(c) for c in sorted(COMMON_CITIES, key=len, reverse=True))
+    + r'))|\b(?:'
+    + "|".join(LOCATION_PREPOSITIONS)
+    + r')\s+(?P<prep_loc>[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?)'
+)
+
+
+_VAGUE_TERMS = _frozen({"here", "there", "somewhere", "nearby", "local", "area"})
 
 
 def is_location_ambiguous(location: Optional[str]) -> bool:
     """Check if the extracted location is too vague."""
     if not location:
         return True
-    
-    vague_terms = {"here", "there", "somewhere", "nearby", "local", "area"}
-    return location.lower() in vague_terms
+    return location.lower() in _VAGUE_TERMS
 
 
 def get_default_location() -> str:
@@ -335,7 +460,7 @@ def get_default_location() -> str:
 # ──────────────────────────────────────────────────────────────────────────────
 
 # Activities that are weather-sensitive
-OUTDOOR_ACTIVITIES = {
+OUTDOOR_ACTIVITIES = _frozen({
     "picnic", "hiking", "hike", "camping", "camp", "beach", "swimming", "swim",
     "bbq", "barbecue", "garden", "gardening", "cycling", "bike", "biking",
     "running", "run", "jogging", "jog", "walking", "walk", "fishing", "fish",
@@ -343,45 +468,61 @@ OUTDOOR_ACTIVITIES = {
     "festival", "concert", "fair", "market", "parade", "wedding", "ceremony",
     "photography", "photoshoot", "zoo", "amusement park", "theme park",
     "kayaking", "surfing", "sailing", "boating", "climbing", "skiing"
-}
+})
 
 # Activities that are NOT weather-sensitive
-INDOOR_ACTIVITIES = {
+INDOOR_ACTIVITIES = _frozen({
     "meeting", "movie", "cinema", "theater", "theatre", "museum", "shopping",
     "dinner", "lunch", "restaurant", "cafe", "coffee", "gym", "workout",
     "office", "work", "study", "library", "class", "lecture", "presentation",
     "interview", "doctor", "dentist", "appointment", "spa", "massage",
     "bowling", "arcade", "escape room", "concert hall", "opera"
-}
+})
+
+
+def _keyword_regex(keywords: frozenset[str]) -> re.Pattern:
+    """Compile a keyword set into one alternation regex (longest-first so
+    multi-word activities like 'theme park' win over 'park')."""
+    alternation = "|".join(
+        re.escape(k) for k in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+# Compiled once at import — classification is a single linear scan instead
+# of one substring search per keyword
+_OUTDOOR_RE = _keyword_regex(OUTDOOR_ACTIVITIES)
+_INDOOR_RE = _keyword_regex(INDOOR_ACTIVITIES)
+
+
+def find_indoor_activities(text: str) -> list[str]:
+    """Indoor activities mentioned in the text (single regex pass, deduped)."""
+    return list(dict.fromkeys(_INDOOR_RE.findall(text.lower())))
 
 
 def classify_activity_weather_sensitivity(text: str) -> tuple[bool, list[str]]:
     """
     Determine if the described activity is weather-sensitive.
-    
+
     Returns: (is_sensitive, list_of_outdoor_activities_found)
     """
     text_lower = text.lower()
-    
-    found_outdoor = []
-    found_indoor = []
-    
-    for activity in OUTDOOR_ACTIVITIES:
-        if activity in text_lower:
-            found_outdoor.append(activity)
-    
-    for activity in INDOOR_ACTIVITIES:
-        if activity in text_lower:
-            found_indoor.append(activity)
-    
+
+    # One pass per category; word boundaries also stop false hits like
+    # "run" inside "brunch" that the old substring scan produced
+    found_outdoor = list(dict.fromkeys(_OUTDOOR_RE.findall(text_lower)))
+
+    # An explicit "outdoor"/"outside" forces a weather-sensitive verdict
+    # regardless of the indoor tally, so skip that scan entirely
+    if "outdoor" in text_lower or "outside" in text_lower:
+        return True, found_outdoor or ["outdoor activity"]
+
+    found_indoor = list(dict.fromkeys(_INDOOR_RE.findall(text_lower)))
+
     # If more outdoor than indoor activities, it's weather-sensitive
     if found_outdoor and len(found_outdoor) >= len(found_indoor):
         return True, found_outdoor
-    
-    # If explicitly mentions "outdoor" or "outside"
-    if "outdoor" in text_lower or "outside" in text_lower:
-        return True, ["outdoor activity"]
-    
+
     # Default to weather-sensitive if no clear indoor activities
     if not found_indoor and not found_outdoor:
         # Conservative: assume weather might matter
@@ -394,64 +535,75 @@ def classify_activity_weather_sensitivity(text: str) -> tuple[bool, list[str]]:
 # Risk Scoring
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Branchless scoring: bisect_right over the ascending thresholds indexes
+# straight into the matching score row (value >= threshold[i] lands at
+# row i+1), so each axis costs one binary search and one tuple index
+_PRECIP_THRESHOLDS = (20, 40, 60, 80)
+_PRECIP_SCORES = (0, 10, 20, 30, 40)
+_WIND_THRESHOLDS = (15, 25, 40)
+_WIND_SCORES = (0, 5, 10, 20)
+_RISK_THRESHOLDS = (20, 40, 60)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+# Severe keywords compiled once; "heavy rain" before "rain" is irrelevant
+# here since any severe hit short-circuits the rain/snow checks
+_SEVERE_RE = re.compile(r"thunderstorm|storm|heavy rain|hail|severe")
+
+
+@lru_cache(maxsize=128)
+def _condition_score(condition_lower: str) -> int:
+    """Severity points for a condition string — classified once per
+    distinct string, then a dict hit. The vocabulary is tiny (wttr.in
+    descriptions plus six simulated conditions), so the cache stays warm."""
+    if _SEVERE_RE.search(condition_lower):
+        return 40
+    if "rain" in condition_lower:
+        return 15
+    if "snow" in condition_lower:
+        return 20
+    return 0
+
+
 def calculate_weather_risk(weather: WeatherCondition) -> RiskLevel:
     """
     Calculate risk level based on weather conditions.
-    
+
     Factors:
     - Precipitation chance
     - Wind speed
     - Severe conditions
     """
-    score = 0
-    
-    # Precipitation impact (0-40 points)
-    if weather.precipitation_chance >= 80:
-        score += 40
-    elif weather.precipitation_chance >= 60:
-        score += 30
-    elif weather.precipitation_chance >= 40:
-        score += 20
-    elif weather.precipitation_chance >= 20:
-        score += 10
-    
-    # Wind impact (0-20 points)
-    if weather.wind_speed_kmh >= 40:
-        score += 20
-    elif weather.wind_speed_kmh >= 25:
-        score += 10
-    elif weather.wind_speed_kmh >= 15:
-        score += 5
-    
-    # Severe weather conditions (0-40 points)
-    severe_keywords = ["thunderstorm", "storm", "heavy rain", "hail", "severe"]
-    if any(kw in weather.condition.lower() for kw in severe_keywords):
-        score += 40
-    elif "rain" in weather.condition.lower():
-        score += 15
-    elif "snow" in weather.condition.lower():
-        score += 20
-    
-    # Convert score to risk level
-    if score >= 60:
-        return RiskLevel.CRITICAL
-    elif score >= 40:
-        return RiskLevel.HIGH
-    elif score >= 20:
-        return RiskLevel.MEDIUM
-    else:
-        return RiskLevel.LOW
+    # Precipitation (0-40) + wind (0-20) + severe conditions (0-40),
+    # then score → level, all via table lookups with zero branches
+    score = (
+        _PRECIP_SCORES[bisect_right(_PRECIP_THRESHOLDS, weather.precipitation_chance)]
+        + _WIND_SCORES[bisect_right(_WIND_THRESHOLDS, weather.wind_speed_kmh)]
+        + _condition_score(weather.condition.lower())
+    )
+    return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, score)]
+
+
+def calculate_weather_risk_batch(weathers: list[WeatherCondition]) -> list[RiskLevel]:
+    """Score a batch of forecasts (e.g., a multi-day horizon) in one call.
+
+    Keeps callers from paying per-call plumbing in a loop; the scalar
+    scorer is already table-driven, so a comprehension is the whole
+    kernel — no array library needed at this scale.
+    """
+    return [calculate_weather_risk(w) for w in weathers]
+
+
+_RISK_COLOR_MAP = {
+    RiskLevel.LOW: "🟢",
+    RiskLevel.MEDIUM: "🟡",
+    RiskLevel.HIGH: "🟠",
+    RiskLevel.CRITICAL: "🔴",
+}
 
 
 def get_risk_color(risk: RiskLevel) -> str:
     """Get display color for risk level (for Streamlit UI)."""
-    color_map = {
-        RiskLevel.LOW: "🟢",
-        RiskLevel.MEDIUM: "🟡",
-        RiskLevel.HIGH: "🟠",
-        RiskLevel.CRITICAL: "🔴"
-    }
-    return color_map.get(risk, "⚪")
+    return _RISK_COLOR_MAP.get(risk, "⚪")
 
 
 def suggest_time_shift(weather: WeatherCondition, original_hour: int) -> Optional[int]:
@@ -480,32 +632,44 @@ def suggest_time_shift(weather: WeatherCondition, original_hour: int) -> Optiona
 # Text Formatting Helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=256)
+def _weather_summary_cached(
+    condition: str, temperature: float, precipitation: int, wind: float
+) -> str:
+    """Memoized formatting core, keyed on the fields that appear in the
+    summary (WeatherCondition itself is not hashable)."""
+    return (
+        f"{condition.title()}, {temperature}°C, "
+        f"{precipitation}% chance of rain, "
+        f"wind {wind} km/h"
+    )
+
+
 def format_weather_summary(weather: WeatherCondition) -> str:
     """Create a human-readable weather summary."""
-    return (
-        f"{weather.condition.title()}, {weather.temperature_celsius}°C, "
-        f"{weather.precipitation_chance}% chance of rain, "
-        f"wind {weather.wind_speed_kmh} km/h"
+    return _weather_summary_cached(
+        weather.condition,
+        weather.temperature_celsius,
+        weather.precipitation_chance,
+        weather.wind_speed_kmh,
     )
 
 
 def format_risk_explanation(risk: RiskLevel, weather: WeatherCondition) -> str:
     """Generate explanation for why a risk level was assigned."""
-    explanations = []
-    
-    if weather.precipitation_chance >= 50:
-        explanations.append(f"High precipitation chance ({weather.precipitation_chance}%)")
-    
-    if weather.wind_speed_kmh >= 25:
-        explanations.append(f"Strong winds ({weather.wind_speed_kmh} km/h)")
-    
-    if "rain" in weather.condition.lower() or "storm" in weather.condition.lower():
-        explanations.append(f"Unfavorable conditions ({weather.condition})")
-    
-    if not explanations:
-        if risk == RiskLevel.LOW:
-            return "Weather conditions are favorable for outdoor activities."
-        else:
-            return "Minor weather concerns that shouldn't significantly impact plans."
-    
-    return " | ".join(explanations)
+    condition = weather.condition.lower()
+    # Conditional fragments fed straight to join — no temp list or appends
+    explanation = " | ".join(filter(None, (
+        f"High precipitation chance ({weather.precipitation_chance}%)"
+        if weather.precipitation_chance >= 50 else None,
+        f"Strong winds ({weather.wind_speed_kmh} km/h)"
+        if weather.wind_speed_kmh >= 25 else None,
+        f"Unfavorable conditions ({weather.condition})"
+        if "rain" in condition or "storm" in condition
+        else None,
+    )))
+    if explanation:
+        return explanation
+    if risk == RiskLevel.LOW:
+        return "Weather conditions are favorable for outdoor activities."
+    return "Minor weather concerns that shouldn't significantly impact plans."